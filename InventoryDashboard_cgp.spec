@@ -20,6 +20,7 @@ a = Analysis(
         'markdown2',
         'pandas',
         'openpyxl',
+        'xlsxwriter',
         'ffmpy',
         'docx',
         'webbrowser',
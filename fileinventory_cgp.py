@@ -21,20 +21,56 @@ New in 6.2 (small, focused change):
 # ==============================================================================
 
 import os
+import re
 import sys
 import time
 import threading
+import uuid
+import weakref
 import datetime
 import openpyxl
-from openpyxl.utils import get_column_letter
+import xlsxwriter
 import platform
 import subprocess
 import gradio as gr
 import pandas as pd
+import numpy as np
 import webbrowser
 import traceback
 import logging
 import shutil  # used for backups/copies
+import functools
+import hashlib
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import ahocorasick  # optional (pyahocorasick): single-pass multi-keyword topic matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pptx  # optional (python-pptx): first-slide title hints
+except ImportError:
+    pptx = None
+
+try:
+    import pyarrow  # optional: Arrow-backed string columns for the filters, Parquet state snapshots
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+try:
+    import xxhash  # optional: faster digest for the unchanged-inventory check
+except ImportError:
+    xxhash = None
+
+try:
+    import cudf  # optional (RAPIDS): GPU substring search for very large inventories
+except ImportError:
+    cudf = None
 
 # --- PyInstaller Windowed Mode Fix ---
 if sys.stderr is None:
@@ -46,26 +82,28 @@ if sys.stderr is None:
     sys.stdout = DummyStream()
 
 # --- Proxy Setup (omitted for brevity, assume it's correct) ---
-PROXY_URL = os.environ.get("HTTP_PROXY_URL", "http://localhost:4321")
-if PROXY_URL:
-    os.environ['http_proxy'] = PROXY_URL
-    os.environ['https_proxy'] = PROXY_URL
-else:
-    pass
-
-current_no_proxy = os.environ.get('NO_PROXY', '')
-additional_no_proxy_hosts = ['localhost', '127.0.0.1', '0.0.0.0']
-new_no_proxy_parts = [host for host in current_no_proxy.split(',') if host.strip()]
-for host in additional_no_proxy_hosts:
-    if host not in new_no_proxy_parts:
-        new_no_proxy_parts.append(host)
-os.environ['NO_PROXY'] = ','.join(new_no_proxy_parts)
+# Runs once per process tree: the sentinel skips it on re-imports (e.g. Gradio reload).
+if not os.environ.get('_INVENTORY_PROXY_INIT'):
+    PROXY_URL = os.environ.get("HTTP_PROXY_URL", "http://localhost:4321")
+    if PROXY_URL:
+        os.environ['http_proxy'] = PROXY_URL
+        os.environ['https_proxy'] = PROXY_URL
+
+    current_no_proxy = os.environ.get('NO_PROXY', '')
+    additional_no_proxy_hosts = ['localhost', '127.0.0.1', '0.0.0.0']
+    new_no_proxy_parts = {host.strip() for host in current_no_proxy.split(',') if host.strip()} | set(additional_no_proxy_hosts)
+    os.environ['NO_PROXY'] = ','.join(sorted(new_no_proxy_parts))
+    os.environ['_INVENTORY_PROXY_INIT'] = '1'
 
 # --- Configuration ---
 VERSION = "6.2.0"
 BUILD_DATE = "2025-09-10"
 START_FOLDER = r"\\synology\YanYan\TB\1.Manuscript"
 INVENTORY_FILENAME = "inventory.xlsx"
+# Sidecar next to the inventory holding the digest of the last saved content
+INVENTORY_HASH_SUFFIX = ".inv.hash"
+# Parquet copy of the last saved inventory (needs pyarrow); read instead of the xlsx while it matches
+INVENTORY_SNAPSHOT_SUFFIX = ".state.parquet"
 
 # Recent folders memory (no new libs; plain text file)
 RECENT_FOLDERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recent_folders.txt")
@@ -87,6 +125,70 @@ TOPIC_KEYWORDS = {
     }
 }
 
+
+def _keyword_alternation(keywords, overlapping=False):
+    """
+    Compile keywords into one case-insensitive alternation (longest first).
+    overlapping=True wraps it in a lookahead so findall also reports overlapping hits.
+    """
+    body = '|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(f'(?=({body}))' if overlapping else body, re.IGNORECASE)
+
+
+def _compile_topic_patterns(topic_definitions):
+    """
+    Precompile topic rules: (keyword_re, all_keywords, {topic: (required, any_of)}).
+    keyword_re is one overlapping alternation over every keyword of every topic
+    (None when there are none), so the text is scanned once for all topics.
+    """
+    rules = {}
+    for topic_name, criteria in topic_definitions.items():
+        required = frozenset(kw.lower() for kw in criteria.get("all_required", []))
+        any_of = frozenset(kw.lower() for kw in (criteria.get("any_of_these") or []))
+        rules[topic_name] = (required, any_of)
+    all_keywords = frozenset().union(*(required | any_of for required, any_of in rules.values()))
+    keyword_re = _keyword_alternation(all_keywords, overlapping=True) if all_keywords else None
+    return keyword_re, all_keywords, rules
+
+
+def _topics_present(rules, present_keywords):
+    """Topics whose rules hold: every required keyword present and, if given, any of any_of."""
+    return [topic_name for topic_name, (required, any_of) in rules.items()
+            if required <= present_keywords and (not any_of or not any_of.isdisjoint(present_keywords))]
+
+
+def _build_topic_automaton(topic_definitions):
+    """
+    Aho-Corasick automaton over every (lowercased) topic keyword.
+    Returns None when pyahocorasick is missing.
+    """
+    if ahocorasick is None:
+        return None
+    keywords = {kw.lower() for criteria in topic_definitions.values()
+                for kw in list(criteria.get("all_required", [])) + list(criteria.get("any_of_these") or [])}
+    if not keywords:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+TOPIC_COMPILED = _compile_topic_patterns(TOPIC_KEYWORDS)
+TOPIC_AUTOMATON = _build_topic_automaton(TOPIC_KEYWORDS)
+
+
+def _prepare_topic_matchers(topic_definitions):
+    """
+    (compiled patterns, automaton) for topic_definitions; prebuilt for TOPIC_KEYWORDS.
+    Build once per scan and pass to check_docx_for_topics for custom definitions.
+    """
+    if topic_definitions is TOPIC_KEYWORDS:
+        return TOPIC_COMPILED, TOPIC_AUTOMATON
+    return _compile_topic_patterns(topic_definitions), _build_topic_automaton(topic_definitions)
+
+
 # File type configurations
 TEXT_BASED_EXTENSIONS = [
     '.docx', '.pptx', '.txt',
@@ -95,6 +197,7 @@ TEXT_BASED_EXTENSIONS = [
 SPREADSHEET_EXTENSIONS = [
     '.xlsx', '.csv', '.prism'
 ]
+TEXT_HINT_READ_BYTES = 4096  # text hints only need the first 2 lines
 
 # Column definitions
 FIELDNAMES = [
@@ -110,13 +213,49 @@ DISPLAY_COLUMNS = [
     'Content Hint', 'Manual_Notes', 'Full Path'
 ]
 
-STATE_COLUMNS = FIELDNAMES + ['Action']  # Columns for the full_df_state
+# Text columns the name/notes/path search looks at
+SEARCH_COLUMNS = [
+    'File Name', 'Manual_Notes', 'Content Hint',
+    'Identified Topics (DOCX)', 'Full Path', 'Last Modified'
+]
+# Lowercased copies kept in the state frame (built once per scan) for the folder/topic filters
+SEARCH_SHADOW_COLUMNS = {'Folder Path': '_lc_folder_path', 'Identified Topics (DOCX)': '_lc_topics'}
+# Lowercased SEARCH_COLUMNS joined with ' || ', built once per scan (refreshed per row on note edits)
+SEARCH_BLOB_COLUMN = '_search_blob'
+# Arrow string kernels for .str operations when pyarrow is available; object dtype otherwise
+SEARCH_STRING_DTYPE = 'string[pyarrow]' if pyarrow is not None else None
+STATE_COLUMNS = FIELDNAMES + ['Action'] + list(SEARCH_SHADOW_COLUMNS.values()) + [SEARCH_BLOB_COLUMN]  # Columns for the full_df_state
+
+# XLSX column widths: fixed per column (contents are bounded), so saving never measures strings
+COLUMN_WIDTHS = {
+    'Folder Path': 70, 'File Name': 50, 'Extension': 12,
+    'Size (Bytes)': 14, 'Last Modified': 28, 'Full Path': 70,
+    'Content Hint': 70, 'Identified Topics (DOCX)': 26,
+    'Status': 22, 'Manual_Notes': 50
+}
+MAX_COLUMN_WIDTH = 70
+
+# Zero-row frames reused (via .copy()) by the callbacks instead of rebuilding them each call
+_EMPTY_DISPLAY_DF = pd.DataFrame(columns=DISPLAY_COLUMNS)
+_EMPTY_STATE_DF = pd.DataFrame(columns=STATE_COLUMNS)
+_EMPTY_STATE_DF['Action'] = '📂'  # Ensure Action column has icon even if 0 rows
+_EMPTY_STATE_DF['Manual_Notes'] = ''
+
+# Rows sent to the browser per table page (the filtered frame stays server-side)
+DISPLAY_PAGE_SIZE = 200
 
 # Error handling configuration
 MAX_BACKUP_FILES = 5
 ERROR_WINDOW_SECONDS = 300
 MAX_ERROR_COUNT = 3
 
+# Note saves arriving within this window are coalesced into one inventory write
+SAVE_COALESCE_SECONDS = 0.5
+
+# Scan configuration (per-file work is I/O bound, threads overlap the latency)
+SCAN_MAX_WORKERS = 16
+SKIP_SCAN_NAMES = {'.git', '__pycache__', '.ipynb_checkpoints', '.DS_Store'}
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -131,6 +270,78 @@ logging.basicConfig(
 # Helper Functions
 # =========================
 
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_TEXT_TAG = _W_NS + 't'
+_W_PARA_TAG = _W_NS + 'p'
+_W_BREAK_TAG = _W_NS + 'br'
+_W_RUN_TAG = _W_NS + 'r'
+_W_HYPERLINK_TAG = _W_NS + 'hyperlink'
+_W_BREAK_TYPE = _W_NS + 'type'
+# Run content other than w:t, rendered as python-docx's Paragraph.text does
+_W_RUN_TEXT = {_W_NS + 'tab': '\t', _W_NS + 'ptab': '\t', _W_NS + 'cr': '\n', _W_NS + 'noBreakHyphen': '-'}
+_RELS_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_DOCX_DEFAULT_MAIN_PART = 'word/document.xml'
+
+
+def _docx_main_part(z):
+    """Name of the main document part, from the officeDocument relationship in _rels/.rels."""
+    try:
+        with z.open('_rels/.rels') as f:
+            for rel in ET.parse(f).getroot().iter(_RELS_NS + 'Relationship'):
+                if rel.get('Type', '').endswith('/officeDocument') and rel.get('Target'):
+                    return rel.get('Target').lstrip('/')
+    except (KeyError, ET.ParseError):
+        pass
+    return _DOCX_DEFAULT_MAIN_PART
+
+
+def _docx_text_fast(filepath):
+    """
+    Stream paragraph texts straight from the main document part (zipfile + iterparse).
+    Much cheaper than building the python-docx object model when only text is needed.
+    Like python-docx's doc.paragraphs, only w:p directly under w:body count (not table
+    cells or text boxes), with the text of their runs (also inside w:hyperlink).
+    Tabs and line breaks come out as '\t' / '\n', like python-docx's Paragraph.text.
+    """
+    with zipfile.ZipFile(filepath) as z, z.open(_docx_main_part(z)) as f:
+        parts = []
+        # stack[0] is w:document, stack[1] w:body, stack[2] a body child
+        stack = []
+        for event, el in ET.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                stack.append(el.tag)
+                continue
+            depth = len(stack)
+            # Run content of a body paragraph: p/r/<item> or p/hyperlink/r/<item>
+            if depth >= 5 and stack[2] == _W_PARA_TAG and stack[-2] == _W_RUN_TAG and \
+                    (depth == 5 or (depth == 6 and stack[3] == _W_HYPERLINK_TAG)):
+                tag = el.tag
+                if tag == _W_TEXT_TAG:
+                    if el.text:
+                        parts.append(el.text)
+                elif tag in _W_RUN_TEXT:
+                    parts.append(_W_RUN_TEXT[tag])
+                elif tag == _W_BREAK_TAG:
+                    # Page and column breaks add no text
+                    if el.get(_W_BREAK_TYPE, 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+            elif depth == 3:
+                if el.tag == _W_PARA_TAG:
+                    yield ''.join(parts)
+                parts.clear()
+                el.clear()  # body children (paragraphs, tables) are not kept
+            stack.pop()
+
+
+@functools.lru_cache(maxsize=256)
+def _load_docx_paragraphs(filepath):
+    """
+    Parse a DOCX once and return its paragraph texts as a tuple.
+    Shared by get_content_hint and check_docx_for_topics; cleared after each scan.
+    """
+    return tuple(_docx_text_fast(filepath))
+
+
 def get_content_hint(filepath, extension):
     """
     Produces a lightweight content hint without new dependencies.
@@ -139,36 +350,39 @@ def get_content_hint(filepath, extension):
     try:
         if extension == '.docx':
             try:
-                import docx
-                doc = docx.Document(filepath)
-                if doc.paragraphs:
-                    hint = "First para: " + doc.paragraphs[0].text[:150] + "..."
+                paragraphs = _load_docx_paragraphs(filepath)
+                if paragraphs:
+                    hint = "First para: " + paragraphs[0][:150] + "..."
                 else:
                     hint = "DOCX: No paragraphs found."
-            except ImportError:
-                hint = "DOCX: 'python-docx' not installed."
             except Exception:
                 hint = "DOCX: Corrupt or unreadable."
         elif extension == '.pptx':
-            try:
-                import pptx
-                prs = pptx.Presentation(filepath)
-                if prs.slides and prs.slides[0].shapes.title:
-                    hint = "First slide title: " + prs.slides[0].shapes.title.text[:150]
-                elif prs.slides:
-                    hint = "PPTX: First slide no title."
-                else:
-                    hint = "PPTX: No slides."
-            except ImportError:
+            if pptx is None:
                 hint = "PPTX: 'python-pptx' not installed."
-            except Exception:
-                hint = "PPTX: Corrupt or unreadable."
+            else:
+                try:
+                    prs = pptx.Presentation(filepath)
+                    if prs.slides and prs.slides[0].shapes.title:
+                        hint = "First slide title: " + prs.slides[0].shapes.title.text[:150]
+                    elif prs.slides:
+                        hint = "PPTX: First slide no title."
+                    else:
+                        hint = "PPTX: No slides."
+                except Exception:
+                    hint = "PPTX: Corrupt or unreadable."
         elif extension in TEXT_BASED_EXTENSIONS:
             try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = [line.strip() for i, line in enumerate(f) if i < 2]
-                    hint_text = " ".join(lines)
-                    hint = ("First 2 lines: " + hint_text[:200] + "...") if hint_text else f"{extension.upper()}: Empty"
+                # Only the first couple of lines are used: read a single capped chunk
+                fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+                try:
+                    data = os.read(fd, TEXT_HINT_READ_BYTES)
+                finally:
+                    os.close(fd)
+                # splitlines: a final newline does not start an (empty) extra line
+                lines = [line.strip() for line in data.decode('utf-8', 'ignore').splitlines()[:2]]
+                hint_text = " ".join(lines)
+                hint = ("First 2 lines: " + hint_text[:200] + "...") if hint_text else f"{extension.upper()}: Empty"
             except Exception as e:
                 hint = f"{extension.upper()}: Read error"
         elif extension in SPREADSHEET_EXTENSIONS:
@@ -178,7 +392,12 @@ def get_content_hint(filepath, extension):
     return hint
 
 
-def check_docx_for_topics(filepath, topic_definitions):
+def check_docx_for_topics(filepath, topic_definitions, topic_matchers=None):
+    """
+    Comma-separated topics whose keyword rules match the DOCX text.
+    topic_matchers: optional result of _prepare_topic_matchers(topic_definitions),
+    so keyword lowercasing/compilation is not repeated for every file.
+    """
     identified_topics = []
     try:
         # Check if file exists and is accessible first
@@ -186,32 +405,49 @@ def check_docx_for_topics(filepath, topic_definitions):
             print(f"Warning: DOCX file not found: {filepath}")
             return "N/A (File not found)"
 
-        import docx
         try:
-            doc = docx.Document(filepath)
+            paragraphs = _load_docx_paragraphs(filepath)
         except Exception as e:
             print(f"Warning: Could not open DOCX {filepath}: {e}")
             return "N/A (Access error)"
 
-        full_text = "\n".join([para.text for para in doc.paragraphs]).lower()
-        if not full_text.strip():
+        if not any(paragraph.strip() for paragraph in paragraphs):
             return "DOCX Empty"
 
-        for topic_name, criteria in topic_definitions.items():
-            all_match = all(kw.lower() in full_text for kw in criteria.get("all_required", []))
-            any_match = True
-            if "any_of_these" in criteria and criteria["any_of_these"]:
-                any_match = any(kw.lower() in full_text for kw in criteria["any_of_these"])
-            if all_match and any_match:
-                identified_topics.append(topic_name)
+        (keyword_re, all_keywords, rules), automaton = topic_matchers or _prepare_topic_matchers(topic_definitions)
+
+        # Topic presence is monotonic, so stream paragraphs and stop once every topic has matched.
+        # Paragraphs were joined by newlines before, so no keyword can span two of them.
+        present_keywords = set()
+        pending = dict(rules)
+        for topic_name in _topics_present(pending, present_keywords):
+            del pending[topic_name]
+        for paragraph in paragraphs:
+            if not pending:
+                break
+            if automaton is not None:
+                new_keywords = {kw for _, kw in automaton.iter(paragraph.lower())}
+            elif keyword_re is not None:
+                found = {m.lower() for m in keyword_re.findall(paragraph)}
+                # A keyword shadowed by a longer one at the same position is a prefix of that match
+                new_keywords = {kw for kw in all_keywords - present_keywords if any(f.startswith(kw) for f in found)}
+            else:
+                break
+            if new_keywords - present_keywords:
+                present_keywords |= new_keywords
+                for topic_name in _topics_present(pending, present_keywords):
+                    del pending[topic_name]
+        identified_topics = [topic_name for topic_name in rules if topic_name not in pending]
     except Exception as e:
         print(f"Error checking DOCX topics for {filepath}: {e}")
         return "N/A (Error reading DOCX)"
     return ", ".join(identified_topics) if identified_topics else "N/A"
 
 
-def _ensure_expected_columns(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
+def _ensure_expected_columns(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+    """Add missing FIELDNAMES columns and coerce Manual_Notes/Size; inplace skips the copy."""
+    if not inplace:
+        df = df.copy()
     for col_name in FIELDNAMES:
         if col_name not in df.columns:
             df[col_name] = '' if col_name == 'Manual_Notes' else pd.NA
@@ -223,24 +459,74 @@ def _ensure_expected_columns(df: pd.DataFrame) -> pd.DataFrame:
 
 
 
+def _coerce_size(value):
+    """Size (Bytes) cell -> int, or None when empty/non-numeric."""
+    if value is None or value == '':
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _format_mtimes(mtimes):
+    """
+    Local-time ISO strings of raw st_mtime floats, exactly as older inventories store them
+    (datetime.fromtimestamp(ts).isoformat(); no fraction when microseconds are 0).
+    Per-value fromtimestamp is faster here than pandas tz_convert + strftime on local zones.
+    """
+    fromtimestamp = datetime.datetime.fromtimestamp
+    return np.array([fromtimestamp(m).isoformat() for m in mtimes], dtype=object)
+
+
 def load_existing_inventory(xlsx_filepath):
     """
     Load existing inventory into a dict keyed by 'Full Path'.
     Missing columns are added. Manual_Notes coerced to string.
+    Read from the Parquet snapshot of the last save when it still matches the file,
+    otherwise rows are streamed from a read-only openpyxl workbook.
     """
     existing_data = {}
     if not os.path.exists(xlsx_filepath):
         print(f"INFO: Inventory file '{xlsx_filepath}' not found. New one will be created.")
         return existing_data
     print(f"INFO: Attempting to load inventory from '{xlsx_filepath}'...")
+    snapshot_df = _read_inventory_snapshot(xlsx_filepath)
+    if snapshot_df is not None:
+        snapshot_df = snapshot_df[snapshot_df['Full Path'].notna() & (snapshot_df['Full Path'] != '')]
+        # Same record shape as the workbook path: None for blanks, int/None sizes
+        columns = {col: snapshot_df[col].to_numpy(dtype=object, na_value=None) for col in FIELDNAMES}
+        for values in zip(*columns.values()):
+            record = dict(zip(FIELDNAMES, values))
+            existing_data[str(record['Full Path'])] = record
+        print(f"INFO: Inventory loaded from snapshot. {len(existing_data)} records from '{xlsx_filepath}'.")
+        return existing_data
     try:
-        df = pd.read_excel(xlsx_filepath, engine='openpyxl')
-        if 'Full Path' not in df.columns:
-            print(f"ERROR: 'Full Path' column missing in '{xlsx_filepath}'. Cannot process.")
-            return {}
-        df = _ensure_expected_columns(df)
-        df.set_index('Full Path', inplace=True)
-        existing_data = df.to_dict(orient='index')
+        wb = openpyxl.load_workbook(xlsx_filepath, read_only=True, data_only=True)
+        try:
+            rows_iter = wb.active.iter_rows(values_only=True)
+            headers = next(rows_iter, None) or ()
+            col_idx = {str(h): i for i, h in enumerate(headers) if h is not None}
+            if 'Full Path' not in col_idx:
+                print(f"ERROR: 'Full Path' column missing in '{xlsx_filepath}'. Cannot process.")
+                return {}
+            full_path_idx = col_idx['Full Path']
+            # Same normalization as _ensure_expected_columns; the missing set is fixed per file
+            missing_columns = dict.fromkeys(col for col in FIELDNAMES if col not in col_idx)
+            column_items = list(col_idx.items())
+            for row in rows_iter:
+                if full_path_idx >= len(row) or row[full_path_idx] in (None, ''):
+                    continue
+                if len(row) == len(headers):
+                    record = {col: row[i] for col, i in column_items}
+                else:
+                    record = {col: (row[i] if i < len(row) else None) for col, i in column_items}
+                record.update(missing_columns)
+                record['Manual_Notes'] = '' if record['Manual_Notes'] is None else str(record['Manual_Notes'])
+                record['Size (Bytes)'] = _coerce_size(record['Size (Bytes)'])
+                existing_data[str(row[full_path_idx])] = record
+        finally:
+            wb.close()
         print(f"INFO: Inventory loaded. {len(existing_data)} records from '{xlsx_filepath}'.")
     except Exception as e:
         print(f"CRITICAL_ERROR loading XLSX from '{xlsx_filepath}': {e}. Inventory will be rebuilt.")
@@ -258,15 +544,15 @@ def create_backup(xlsx_filepath, max_backups=5):
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = f"{xlsx_filepath}.bak.{timestamp}"
 
-            # Get existing backups
+            # Get existing backups from one scandir pass (d_type answers is_file, no extra stat);
+            # the embedded timestamp sorts oldest-first, so ctime is not needed
             dir_name = os.path.dirname(xlsx_filepath) or "."
-            prefix = os.path.basename(xlsx_filepath) + ".bak"
-            existing_backups = [f for f in os.listdir(dir_name) if f.startswith(prefix)]
+            prefix = os.path.basename(xlsx_filepath) + ".bak."
+            with os.scandir(dir_name) as it:
+                existing_backups = sorted(e.name for e in it if e.name.startswith(prefix) and e.is_file())
 
-            # Remove oldest if too many
-            if len(existing_backups) >= max_backups:
-                oldest_backup = min(existing_backups, key=lambda x: os.path.getctime(
-                    os.path.join(dir_name, x)))
+            # Remove oldest so that, with the new one, at most max_backups remain
+            for oldest_backup in existing_backups[:max(len(existing_backups) - (max_backups - 1), 0)]:
                 os.remove(os.path.join(dir_name, oldest_backup))
 
             shutil.copy2(xlsx_filepath, backup_path)
@@ -276,55 +562,231 @@ def create_backup(xlsx_filepath, max_backups=5):
     return False
 
 
-def _merge_existing_notes(df_new: pd.DataFrame, xlsx_filepath: str) -> pd.DataFrame:
+def _read_notes_map(xlsx_filepath):
+    """
+    {full_path: note} from an inventory workbook, streamed read-only (values only,
+    two columns) rather than parsing the whole sheet into a DataFrame.
+    """
+    wb = openpyxl.load_workbook(xlsx_filepath, read_only=True, data_only=True)
+    try:
+        rows_iter = wb.active.iter_rows(values_only=True)
+        headers = [str(h) if h is not None else None for h in (next(rows_iter, None) or ())]
+        if 'Full Path' not in headers or 'Manual_Notes' not in headers:
+            return {}
+        path_idx, notes_idx = headers.index('Full Path'), headers.index('Manual_Notes')
+        notes = {}
+        for row in rows_iter:
+            path = row[path_idx] if path_idx < len(row) else None
+            if path in (None, ''):
+                continue
+            note = row[notes_idx] if notes_idx < len(row) else None
+            notes[path] = '' if note is None else str(note)
+        return notes
+    finally:
+        wb.close()
+
+
+def _merge_existing_notes(df_new: pd.DataFrame, xlsx_filepath: str, existing_notes=None,
+                          normalized: bool = False) -> pd.DataFrame:
     """
     Merge Manual_Notes from existing file into df_new based on 'Full Path'.
     Does not overwrite non-empty notes in df_new.
+    existing_notes: optional {full_path: note} already loaded by the caller; the file is
+    only re-read when it is None.
+    normalized: df_new already went through _ensure_expected_columns and is owned by the
+    caller, so it is updated in place without re-coercing Manual_Notes.
     """
-    df = df_new.copy()
+    df = df_new if normalized else df_new.copy()
     try:
-        if os.path.exists(xlsx_filepath):
-            existing_df = pd.read_excel(xlsx_filepath, engine='openpyxl')
-            if 'Full Path' in existing_df.columns and 'Manual_Notes' in existing_df.columns:
-                existing_df = _ensure_expected_columns(existing_df)
-                existing_notes = existing_df.set_index('Full Path')['Manual_Notes'].to_dict()
-
-                df = df.set_index('Full Path')
-                if 'Manual_Notes' not in df.columns:
-                    df['Manual_Notes'] = ''
-                df['Manual_Notes'] = df['Manual_Notes'].fillna('').astype(str)
-
-                for idx in df.index:
-                    current_note = str(df.at[idx, 'Manual_Notes']).strip()
-                    if not current_note and idx in existing_notes:
-                        df.at[idx, 'Manual_Notes'] = existing_notes[idx]
-
-                df = df.reset_index()
+        if existing_notes is None:
+            if not os.path.exists(xlsx_filepath):
+                return df
+            existing_notes = _read_notes_map(xlsx_filepath)
+        if not existing_notes:
+            return df
+
+        if normalized:
+            current_notes = df['Manual_Notes']
+        else:
+            if 'Manual_Notes' not in df.columns:
+                df['Manual_Notes'] = ''
+            current_notes = df['Manual_Notes'].fillna('').astype(str)
+        stored_notes = df['Full Path'].map(existing_notes)
+        fill = (current_notes.str.strip() == '') & stored_notes.notna()
+        df['Manual_Notes'] = current_notes.where(~fill, stored_notes)
     except Exception as e:
         print(f"Warning: Error merging existing notes: {e}")
     return df
 
 
-def save_inventory_to_xlsx(data_to_save, xlsx_filepath):
+def _is_valid_xlsx_container(xlsx_filepath):
     """
-    Save inventory to XLSX with:
-    - Merge of existing Manual_Notes (never lose notes).
-    - Temp write + verify + replace.
-    - Column width autosizing.
+    Cheap integrity check for a written workbook: ZIP magic bytes and a clean
+    testzip() over the archive members (no XML parsing).
     """
-    if not isinstance(data_to_save, list):
-        print("ERROR: Data to save is not a list.")
+    try:
+        with open(xlsx_filepath, 'rb') as f:
+            if f.read(4) != b'PK\x03\x04':
+                return False
+        with zipfile.ZipFile(xlsx_filepath, 'r') as zf:
+            return zf.testzip() is None
+    except (OSError, zipfile.BadZipFile):
         return False
 
+
+def _is_recoverable_xlsx(xlsx_filepath):
+    """
+    Structural check plus at least one data row below the header. The sheet is streamed
+    read-only and parsing stops at row 2, instead of loading it all with read_excel.
+    """
+    if not _is_valid_xlsx_container(xlsx_filepath):
+        return False
     try:
-        df = pd.DataFrame(data_to_save if data_to_save else [], columns=FIELDNAMES)
-        df = _ensure_expected_columns(df)
+        # Opened as a file object: openpyxl rejects paths by extension (e.g. '.bak')
+        with open(xlsx_filepath, 'rb') as f:
+            wb = openpyxl.load_workbook(f, read_only=True, data_only=True)
+            try:
+                for row in wb.active.iter_rows(min_row=2, max_row=2, values_only=True):
+                    return any(value is not None for value in row)
+                return False
+            finally:
+                wb.close()
+    except Exception:
+        return False
 
-        # Merge existing notes so we never lose them
-        df = _merge_existing_notes(df, xlsx_filepath)
 
-        # Ensure Manual_Notes column exists and is properly formatted
-        df['Manual_Notes'] = df['Manual_Notes'].fillna('').astype(str)
+def _inventory_digest(df: pd.DataFrame) -> str:
+    """Content digest of the rows to be written (vectorized per-row hashes, then xxh3/blake2b)."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+    if xxhash is not None:
+        return xxhash.xxh3_64(row_hashes).hexdigest()
+    return hashlib.blake2b(row_hashes, digest_size=8).hexdigest()
+
+
+def _read_inventory_digest(xlsx_filepath):
+    try:
+        with open(xlsx_filepath + INVENTORY_HASH_SUFFIX, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_inventory_digest(xlsx_filepath, digest):
+    try:
+        with open(xlsx_filepath + INVENTORY_HASH_SUFFIX, 'w', encoding='utf-8') as f:
+            f.write(digest)
+    except OSError as e:
+        print(f"Warning: Could not write inventory hash: {e}")
+
+
+def _inventory_stat_key(xlsx_filepath):
+    """'mtime_ns:size' of the inventory file; a snapshot is only valid for the file it was taken from."""
+    st = os.stat(xlsx_filepath)
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _folder_entries_key(folder_path):
+    """
+    Digest of the folder's entry names, leaving out the inventory, its sidecars/temp files
+    and Office lock files. Saving, snapshotting and backups touch only those, so unlike the
+    folder mtime the key changes only when something else was added, removed or renamed.
+    """
+    inventory_name_lower = INVENTORY_FILENAME.lower()
+    with os.scandir(folder_path) as it:
+        names = sorted(e.name for e in it
+                       if not e.name.lower().startswith(inventory_name_lower) and not e.name.startswith("~$"))
+    return hashlib.blake2b('\0'.join(names).encode('utf-8', 'surrogateescape'), digest_size=8).hexdigest()
+
+
+def _snapshot_metadata(xlsx_filepath):
+    """Schema metadata of the INVENTORY_SNAPSHOT_SUFFIX file ({} if missing/unreadable); only the footer is read."""
+    if pyarrow is None:
+        return {}
+    try:
+        return pyarrow.parquet.read_schema(xlsx_filepath + INVENTORY_SNAPSHOT_SUFFIX).metadata or {}
+    except Exception:
+        return {}
+
+
+def _snapshot_is_current(xlsx_filepath) -> bool:
+    """True when the INVENTORY_SNAPSHOT_SUFFIX file was written for the inventory as it is now."""
+    try:
+        return _snapshot_metadata(xlsx_filepath).get(b'inventory_stat') == _inventory_stat_key(xlsx_filepath).encode()
+    except OSError:
+        return False
+
+
+def _write_inventory_snapshot(xlsx_filepath, df: pd.DataFrame):
+    """
+    Parquet (zstd) copy of the saved inventory rows, tagged with the inventory's stat key
+    and its folder's _folder_entries_key.
+    Editing or restoring the xlsx changes its mtime/size, which invalidates the snapshot.
+    """
+    if pyarrow is None:
+        return
+    snapshot_path = xlsx_filepath + INVENTORY_SNAPSHOT_SUFFIX
+    temp_path = snapshot_path + ".tmp"
+    try:
+        # Mixed-type object cells (e.g. numbers typed into Notes in Excel) are stored as text
+        table = pyarrow.Table.from_pandas(df.astype({col: str for col in df.columns if df[col].dtype == object})
+                                          .where(df.notna(), None), preserve_index=False)
+        folder_path = os.path.dirname(os.path.abspath(xlsx_filepath))
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               b'inventory_stat': _inventory_stat_key(xlsx_filepath).encode(),
+                                               b'folder_entries': _folder_entries_key(folder_path).encode()})
+        pyarrow.parquet.write_table(table, temp_path, compression='zstd')
+        os.replace(temp_path, snapshot_path)
+    except Exception as e:
+        print(f"Warning: Could not write inventory snapshot: {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def _read_inventory_snapshot(xlsx_filepath):
+    """Inventory rows (FIELDNAMES) from a current snapshot, or None when there is none."""
+    if not _snapshot_is_current(xlsx_filepath):
+        return None
+    try:
+        df = pd.read_parquet(xlsx_filepath + INVENTORY_SNAPSHOT_SUFFIX, engine='pyarrow')
+        return _ensure_expected_columns(df.reindex(columns=FIELDNAMES), inplace=True)
+    except Exception as e:
+        print(f"Warning: Could not read inventory snapshot: {e}")
+        return None
+
+
+def save_inventory_to_xlsx(data_to_save, xlsx_filepath, existing_notes=None, skip_if_unchanged=False):
+    """
+    Save inventory (DataFrame or list of row dicts) to XLSX with:
+    - Merge of existing Manual_Notes (never lose notes); pass existing_notes
+      ({full_path: note}) when the old inventory is already loaded to skip re-reading it.
+    - skip_if_unchanged: leave the file alone when the content digest matches the
+      INVENTORY_HASH_SUFFIX sidecar written by the last save.
+    - Temp write + structural verify + replace.
+    - Streaming XlsxWriter (constant_memory) workbook with fixed COLUMN_WIDTHS.
+    """
+    if not isinstance(data_to_save, (list, pd.DataFrame)):
+        print("ERROR: Data to save is not a list or DataFrame.")
+        return False
+
+    try:
+        if isinstance(data_to_save, pd.DataFrame):
+            df = data_to_save.reindex(columns=FIELDNAMES)
+        else:
+            df = pd.DataFrame(data_to_save if data_to_save else [], columns=FIELDNAMES)
+        # df is already a new frame (reindex/constructor), so normalize it in place, once
+        df = _ensure_expected_columns(df, inplace=True)
+
+        # Merge existing notes so we never lose them (Manual_Notes stays str)
+        df = _merge_existing_notes(df, xlsx_filepath, existing_notes, normalized=True)
+
+        digest = _inventory_digest(df)
+        if skip_if_unchanged and os.path.exists(xlsx_filepath) and _read_inventory_digest(xlsx_filepath) == digest:
+            print(f"Inventory unchanged: '{xlsx_filepath}' not rewritten.")
+            if not _snapshot_is_current(xlsx_filepath):
+                _write_inventory_snapshot(xlsx_filepath, df)
+            return True
 
         # Create simple rolling backup (non-rotating) in addition to rotating backups
         if os.path.exists(xlsx_filepath):
@@ -339,27 +801,38 @@ def save_inventory_to_xlsx(data_to_save, xlsx_filepath):
 
         # Save to temporary file
         try:
-            with pd.ExcelWriter(temp_filepath, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='File Inventory')
-                worksheet = writer.sheets['File Inventory']
-                for idx, col in enumerate(df.columns, 1):
-                    max_length = max(
-                        df[col].astype(str).str.len().max(),
-                        len(str(col))
-                    )
-                    if pd.isna(max_length):
-                        max_length = len(str(col))
-                    worksheet.column_dimensions[get_column_letter(idx)].width = min(int(max_length) + 2, 70)
+            # XlsxWriter constant_memory flushes each row to disk as it is written.
+            # Strings are written verbatim (no formula/URL auto-conversion of file names).
+            wb = xlsxwriter.Workbook(temp_filepath, {
+                'constant_memory': True,
+                'strings_to_formulas': False,
+                'strings_to_urls': False
+            })
+            try:
+                worksheet = wb.add_worksheet('File Inventory')
+                for idx, col in enumerate(df.columns):
+                    worksheet.set_column(idx, idx, COLUMN_WIDTHS.get(col, MAX_COLUMN_WIDTH))
+                worksheet.write_row(0, 0, list(df.columns))
+                # pd.NA/NaN become None, which XlsxWriter leaves as empty cells
+                column_values = [df[col].to_numpy(dtype=object, na_value=None) for col in df.columns]
+                for row_idx, row in enumerate(zip(*column_values), 1):
+                    worksheet.write_row(row_idx, 0, row)
+            finally:
+                wb.close()
 
             # Verify temp file was written correctly
             if os.path.exists(temp_filepath) and os.path.getsize(temp_filepath) > 0:
-                # Read back temp file to verify
-                pd.read_excel(temp_filepath, engine='openpyxl')
+                # Structural check only (ZIP magic + CRCs); re-parsing the sheet is slower than the write
+                if not _is_valid_xlsx_container(temp_filepath):
+                    print(f"ERROR: Temporary save file '{temp_filepath}' failed verification.")
+                    return False
 
                 # If verification passed, replace original
                 if os.path.exists(xlsx_filepath):
                     os.remove(xlsx_filepath)
                 os.rename(temp_filepath, xlsx_filepath)
+                _write_inventory_digest(xlsx_filepath, digest)
+                _write_inventory_snapshot(xlsx_filepath, df)
                 print(f"Inventory saved successfully: {len(df)} entries to '{xlsx_filepath}'")
                 return True
 
@@ -379,97 +852,201 @@ def save_inventory_to_xlsx(data_to_save, xlsx_filepath):
         return False
 
 
-def process_folder_inventory(start_folder_path, xlsx_output_path, topic_keywords_config):
+def _walk_scandir(path):
     """
-    Build the current file list, detect Added/Updated, and optionally carry forward
-    Removed items that have Manual_Notes (to preserve user-entered notes).
+    Yield file DirEntry objects below path (symlinked dirs are not followed).
+    DirEntry caches its stat result, so callers avoid a second os.stat per file.
+    Iterative (explicit stack): no recursion limit and no yield-from chain per nesting level.
     """
-    if not os.path.isdir(start_folder_path):
-        return [], f"Error: Start folder '{start_folder_path}' not found.", 0, 0, 0
+    pending_dirs = [path]
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        subdirs = []
+        try:
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    if entry.name in SKIP_SCAN_NAMES:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif not entry.is_dir():
+                            yield entry
+                    except OSError as e:
+                        print(f"Warning: Could not read entry '{entry.path}': {e}. Skipping.")
+        except OSError as e:
+            print(f"Warning: Could not read folder '{current_dir}': {e}. Skipping.")
+            continue
+        # Reversed so subfolders are visited in listing order (top-down, like os.walk)
+        pending_dirs.extend(reversed(subdirs))
 
-    existing_inventory_map = load_existing_inventory(xlsx_output_path)
-    paths_from_old_inventory = set(existing_inventory_map.keys())
 
-    current_inventory_list = []
-    file_count, updates_count, adds_count, removed_count = 0, 0, 0, 0
+def _scan_metadata(start_folder_path, xlsx_output_path):
+    """
+    Walk the tree and yield (folder, name, extension, size, st_mtime, full_path) per file.
+    Only directory listings and stat results are used; file contents are read later.
+    """
+    inventory_name_lower = INVENTORY_FILENAME.lower()
+    inventory_sidecar_prefixes = (inventory_name_lower + INVENTORY_HASH_SUFFIX, inventory_name_lower + ".bak",
+                                  inventory_name_lower + INVENTORY_SNAPSHOT_SUFFIX)
+    output_abs_path = os.path.abspath(xlsx_output_path)
+    for entry in _walk_scandir(os.path.abspath(start_folder_path)):
+        name = entry.name
+        name_lower = name.lower()
+        if name_lower == inventory_name_lower or name.startswith("~$"):  # Skip inventories and Office temp files
+            continue
+        # ...and the inventory's own sidecars (hash, snapshot, .bak copies), which change on every save
+        if name_lower.startswith(inventory_sidecar_prefixes):
+            continue
+        # Avoid listing the output inventory file itself
+        if entry.path == output_abs_path:
+            continue
+        try:
+            # Symlinked files are listed with their target's size and mtime; broken links raise here
+            stat_info = entry.stat()
+        except OSError as e:
+            print(f"Warning: Could not process file '{entry.path}': {e}. Skipping.")
+            continue
+        # the walk starts from an absolute path, so entry.path is the 'Full Path'
+        yield (os.path.dirname(entry.path), name, os.path.splitext(name)[1].lower(),
+               stat_info.st_size, stat_info.st_mtime, entry.path)
 
-    for root, dirs, files in os.walk(start_folder_path, topdown=True):
-        files = [f for f in files if f.lower() != INVENTORY_FILENAME.lower()]
 
-        # Avoid listing the output inventory file itself
-        if os.path.abspath(root) == os.path.dirname(os.path.abspath(xlsx_output_path)):
-            files = [f for f in files if os.path.basename(f) != os.path.basename(xlsx_output_path)]
+def _enrich_one_file(filepath, ext, topic_keywords_config, topic_matchers=None):
+    """
+    (Content Hint, Identified Topics (DOCX)) for one file. Runs in a worker thread;
+    errors are contained here so one unreadable file does not poison the batch.
+    """
+    try:
+        hint = get_content_hint(filepath, ext)
+        topics = check_docx_for_topics(filepath, topic_keywords_config, topic_matchers) if ext == '.docx' else "N/A"
+        return hint, topics
+    except Exception as e:
+        print(f"Warning: Could not read file '{filepath}': {e}.")
+        return f"Hint Error for {os.path.basename(filepath)}: {e}", "N/A"
 
-        for filename in files:
-            if filename.startswith("~$"):  # Skip Office temp files
-                continue
 
-            filepath = os.path.join(root, filename)
-            abs_filepath = os.path.abspath(filepath)
-            try:
-                stat_info = os.stat(filepath)
-                ext = os.path.splitext(filename)[1].lower()
-
-                # Initialize with FIELDNAMES
-                current_file_data = {key: ('' if key == 'Manual_Notes' else pd.NA) for key in FIELDNAMES}
-                current_file_data.update({
-                    'Folder Path': root,
-                    'File Name': filename,
-                    'Extension': ext,
-                    'Size (Bytes)': stat_info.st_size,
-                    'Last Modified': datetime.datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                    'Full Path': abs_filepath,
-                    'Content Hint': get_content_hint(filepath, ext),
-                    'Identified Topics (DOCX)': "N/A",
-                    'Status': 'Active',
-                    'Manual_Notes': ''
-                })
-
-                if ext == '.docx':
-                    current_file_data['Identified Topics (DOCX)'] = check_docx_for_topics(filepath, topic_keywords_config)
-
-                if abs_filepath in existing_inventory_map:
-                    old_data = existing_inventory_map[abs_filepath]
-                    # Always carry forward existing notes
-                    current_file_data['Manual_Notes'] = str(old_data.get('Manual_Notes', '') or '')
-
-                    # Detect update
-                    old_size = old_data.get('Size (Bytes)')
-                    old_mtime = old_data.get('Last Modified')
-                    if (pd.notna(old_size) and old_size != stat_info.st_size) or (pd.notna(old_mtime) and old_mtime != current_file_data['Last Modified']):
-                        current_file_data['Status'] = 'Updated'
-                        updates_count += 1
-
-                    paths_from_old_inventory.discard(abs_filepath)
-                else:
-                    current_file_data['Status'] = 'Added'
-                    adds_count += 1
+def _enrich_files(paths, exts, topic_keywords_config):
+    """
+    Yield (Content Hint, Identified Topics (DOCX)) for each path, in order,
+    reading the files on a thread pool.
+    """
+    # Lowercase/compile the topic keywords once for the whole scan
+    topic_matchers = _prepare_topic_matchers(topic_keywords_config)
+    # Don't spin up more threads than there are files to read
+    with ThreadPoolExecutor(max_workers=max(1, min(SCAN_MAX_WORKERS, len(paths)))) as executor:
+        yield from executor.map(lambda p, e: _enrich_one_file(p, e, topic_keywords_config, topic_matchers), paths, exts)
 
-                current_inventory_list.append(current_file_data)
-                file_count += 1
 
-            except Exception as e:
-                print(f"Warning: Could not process file '{filepath}': {e}. Skipping.")
-                pass
+def _inventory_frame_from_rows(rows, columns=FIELDNAMES):
+    """
+    Build a DataFrame from row tuples (any iterable, e.g. the _scan_metadata generator):
+    zip(*rows) transposes them into one list per column, so pandas builds each
+    column directly (no per-row dicts).
+    """
+    transposed = list(zip(*rows)) or [()] * len(columns)
+    data = {name: list(col) for name, col in zip(columns, transposed)}
+    if 'Size (Bytes)' in data:
+        data['Size (Bytes)'] = pd.array(data['Size (Bytes)'], dtype='Int64')
+    return pd.DataFrame(data, columns=columns)
+
+
+_SCAN_METADATA_COLUMNS = ['Folder Path', 'File Name', 'Extension', 'Size (Bytes)', '_mtime_raw', 'Full Path']
+
+
+def process_folder_inventory(start_folder_path, xlsx_output_path, topic_keywords_config):
+    """
+    Build the current file list, detect Added/Updated, and optionally carry forward
+    Removed items that have Manual_Notes (to preserve user-entered notes).
+    1. _scan_metadata: os.scandir walk collects stat metadata only.
+    2. Added/Updated/Active is decided by one vectorized merge with the old inventory.
+    3. _enrich_files: only Added/Updated files are opened for hints/topics, on a thread pool.
+    Returns the inventory as a DataFrame with FIELDNAMES columns, plus the
+    {full_path: note} map of the old inventory so saving need not re-read it.
+    """
+    if not os.path.isdir(start_folder_path):
+        return _inventory_frame_from_rows([]), f"Error: Start folder '{start_folder_path}' not found.", 0, 0, 0, {}
+
+    existing_inventory_map = load_existing_inventory(xlsx_output_path)
+
+    current_df = _inventory_frame_from_rows(_scan_metadata(start_folder_path, xlsx_output_path), _SCAN_METADATA_COLUMNS)
+
+    old_records = list(existing_inventory_map.values())
+    old_df = pd.DataFrame({
+        'Full Path': list(existing_inventory_map.keys()),
+        '_in_old': [True] * len(old_records),
+        'Size (Bytes)_old': pd.array([r.get('Size (Bytes)') for r in old_records], dtype='Int64'),
+        'Last Modified_old': [r.get('Last Modified') for r in old_records],
+        'Content Hint_old': [r.get('Content Hint') for r in old_records],
+        'Identified Topics (DOCX)_old': [r.get('Identified Topics (DOCX)') for r in old_records],
+        'Manual_Notes_old': [r.get('Manual_Notes') for r in old_records],
+    })
+    merged = current_df.merge(old_df, on='Full Path', how='left')  # keeps walk order
+
+    # Detect update: size differs, or the stored Last Modified differs from the current one
+    has_old = merged['_in_old'].notna().to_numpy()
+    size_old = merged['Size (Bytes)_old']
+    size_known = size_old.notna().to_numpy()
+    size_changed = size_known & (size_old != merged['Size (Bytes)']).fillna(False).to_numpy(dtype=bool)
+    mtime_known = merged['Last Modified_old'].notna().to_numpy()
+    # Stored values are compared as written (naive local ISO strings), so nothing is parsed
+    # back and the repeated fall-back hour is not ambiguous
+    last_modified = _format_mtimes(merged['_mtime_raw'].to_numpy(dtype='float64'))
+    mtime_same = merged['Last Modified_old'].to_numpy(dtype=object) == last_modified
+    changed = size_changed | (mtime_known & ~mtime_same)
+    status = np.where(~has_old, 'Added', np.where(changed, 'Updated', 'Active'))
+
+    # Unchanged files reuse the previous hint/topics; everything else is re-read.
+    # A stored row with an empty hint (or empty topics for a DOCX) has nothing to reuse.
+    hint_known = merged['Content Hint_old'].notna().to_numpy()
+    topics_known = merged['Identified Topics (DOCX)_old'].notna().to_numpy() | (merged['Extension'] != '.docx').to_numpy()
+    unchanged = has_old & ~changed & size_known & mtime_known & hint_known & topics_known
+    hints = merged['Content Hint_old'].fillna("N/A").to_numpy(dtype=object, copy=True)
+    topics = merged['Identified Topics (DOCX)_old'].fillna("N/A").to_numpy(dtype=object, copy=True)
+    to_enrich = np.flatnonzero(~unchanged)
+    if len(to_enrich):
+        paths = merged['Full Path'].to_numpy()[to_enrich]
+        exts = merged['Extension'].to_numpy()[to_enrich]
+        try:
+            for i, (hint, topic) in zip(to_enrich, _enrich_files(paths, exts, topic_keywords_config)):
+                hints[i] = hint
+                topics[i] = topic
+        finally:
+            # Parsed DOCX paragraphs are only needed while reading; drop them even if the scan fails
+            _load_docx_paragraphs.cache_clear()
+
+    merged['Last Modified'] = last_modified
+    merged['Content Hint'] = hints
+    merged['Identified Topics (DOCX)'] = topics
+    merged['Status'] = status
+    # Always carry forward existing notes
+    merged['Manual_Notes'] = merged['Manual_Notes_old'].fillna('').astype(str)
+    inventory_df = merged[FIELDNAMES]
+
+    file_count = len(inventory_df)
+    adds_count = int((status == 'Added').sum())
+    updates_count = int((status == 'Updated').sum())
+    # Same vectorized membership test for the other direction; keeps the old inventory's order
+    removed_paths = old_df['Full Path'].loc[~old_df['Full Path'].isin(current_df['Full Path'])].tolist()
 
     # Handle removed files: retain ONLY those with Manual_Notes to preserve user writing
-    for old_path in list(paths_from_old_inventory):
-        old_row = existing_inventory_map.get(old_path, {})
-        # Normalize notes
-        old_note = str(old_row.get('Manual_Notes', '') or '')
-        if old_note.strip():
-            # Build a row using existing data (keep prior metadata if present)
-            removed_file_data = {key: old_row.get(key, ('' if key == 'Manual_Notes' else pd.NA)) for key in FIELDNAMES}
-            removed_file_data['Status'] = 'Removed (Not Found)'
-            removed_file_data['Manual_Notes'] = old_note
-            # Ensure Full Path is set (index was 'Full Path')
-            removed_file_data['Full Path'] = old_path
-            current_inventory_list.append(removed_file_data)
-            removed_count += 1
-        # else: no notes -> drop from inventory to reduce noise
+    removed_count = 0
+    # Removed rows without notes are dropped from the inventory to reduce noise
+    kept_paths = [p for p in removed_paths if existing_inventory_map[p]['Manual_Notes'].strip()]
+    if kept_paths:
+        kept_records = [existing_inventory_map[p] for p in kept_paths]
+        # One list per column (keeping prior metadata where present) instead of a frame of row dicts
+        removed_df = pd.DataFrame({col: [r.get(col) for r in kept_records] for col in FIELDNAMES}, columns=FIELDNAMES)
+        removed_df['Status'] = 'Removed (Not Found)'
+        # Ensure Full Path is set (the map is keyed by 'Full Path')
+        removed_df['Full Path'] = kept_paths
+        removed_df['Size (Bytes)'] = pd.array(removed_df['Size (Bytes)'], dtype='Int64')
+        removed_count = len(removed_df)
+        inventory_df = pd.concat([inventory_df, removed_df], ignore_index=True)
 
     status_message = f"Scan Complete. Found {file_count} files. ({adds_count} new, {updates_count} updated, {removed_count} removed-kept-with-notes)."
-    return current_inventory_list, status_message, adds_count, updates_count, removed_count
+    existing_notes = {p: r.get('Manual_Notes', '') for p, r in existing_inventory_map.items()}
+    return inventory_df, status_message, adds_count, updates_count, removed_count, existing_notes
 
 
 # =========================
@@ -495,18 +1072,32 @@ def _read_recent_folders():
 
 def _write_recent_folders(paths_list):
     try:
-        with open(RECENT_FOLDERS_FILE, 'w', encoding='utf-8') as f:
+        # Write a temp file and swap it in, so a crash never leaves a truncated list
+        temp_path = RECENT_FOLDERS_FILE + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
             for p in paths_list[:MAX_RECENT_FOLDERS]:
                 f.write(p + '\n')
+        os.replace(temp_path, RECENT_FOLDERS_FILE)
     except Exception as e:
         print(f"Warning writing recent folders: {e}")
 
+# In-memory copy of the recent list (read from disk on first use, written only on change)
+_recent_cache = None
+_recent_cache_lock = threading.Lock()
+
+def _cached_recent_folders():
+    global _recent_cache
+    with _recent_cache_lock:
+        if _recent_cache is None:
+            _recent_cache = _read_recent_folders()
+        return list(_recent_cache)
+
 def load_recent_folders(initial_choice=None):
     """
     Returns (choices, value) for the dropdown.
     Ensures START_FOLDER is present at least on first run.
     """
-    choices = _read_recent_folders()
+    choices = _cached_recent_folders()
     if not choices:
         choices = [START_FOLDER]
     else:
@@ -522,6 +1113,7 @@ def add_recent_folder(path_str):
     Add a folder to the recent list (dedup, move-to-front).
     Only add if it looks like a valid folder path on this machine.
     """
+    global _recent_cache
     try:
         p = str(path_str or '').strip()
         if not p:
@@ -529,10 +1121,15 @@ def add_recent_folder(path_str):
         if not os.path.isdir(p):
             # do not add invalid paths
             return
-        current = _read_recent_folders()
+        current = _cached_recent_folders()
+        if current and current[0] == p:
+            return  # already most recent: nothing to persist
         # move-to-front dedup
         current = [x for x in current if x != p]
         current.insert(0, p)
+        current = current[:MAX_RECENT_FOLDERS]
+        with _recent_cache_lock:
+            _recent_cache = current
         _write_recent_folders(current)
     except Exception as e:
         print(f"Warning adding recent folder: {e}")
@@ -548,6 +1145,9 @@ def shutdown_server():
         gr.Info("Shutting down gracefully...")
         time.sleep(0.5)  # Give UI time to show message
 
+        # Finish queued note saves before exiting (os._exit skips atexit)
+        inventory_writer.wait(timeout=30)
+
         # Create backup if needed
         if hasattr(demo, 'current_xlsx_path_state') and demo.current_xlsx_path_state:
             create_backup(demo.current_xlsx_path_state)
@@ -565,19 +1165,26 @@ def shutdown_server():
         os._exit(1)  # Emergency exit if graceful shutdown fails
 
 
+_OS_NAME = platform.system()  # fixed for the life of the process
+_OPEN_FOLDER_COMMANDS = {
+    "Windows": lambda folder: os.startfile(folder),
+    "Darwin": lambda folder: subprocess.run(["open", folder], check=True),
+}
+
+
+def _xdg_open(folder):
+    subprocess.run(["xdg-open", folder], check=True)
+
+
 def open_containing_folder_os(path_to_item):
     if not path_to_item or not isinstance(path_to_item, str):
         return "Error: Invalid path."
     if not os.path.exists(path_to_item):
         return f"Error: Path does not exist: {path_to_item}"
+    # Inventory paths are absolute, so abspath/dirname are string operations (exists is the only stat)
     folder_to_open = os.path.dirname(os.path.abspath(path_to_item))
     try:
-        if platform.system() == "Windows":
-            os.startfile(folder_to_open)
-        elif platform.system() == "Darwin":
-            subprocess.run(["open", folder_to_open], check=True)
-        else:
-            subprocess.run(["xdg-open", folder_to_open], check=True)
+        _OPEN_FOLDER_COMMANDS.get(_OS_NAME, _xdg_open)(folder_to_open)
         return f"Opened: {folder_to_open}"
     except Exception as e:
         return f"Error opening folder '{folder_to_open}': {e}"
@@ -587,9 +1194,10 @@ def handle_action_click(current_df_displayed: pd.DataFrame, evt: gr.SelectData):
     try:
         if evt is None or evt.index is None or not hasattr(evt, 'index'):
             return "No cell selected."
-        clicked_column_name = current_df_displayed.columns[evt.index[1]]
-        if clicked_column_name == 'Action':
-            path_to_open = current_df_displayed.iloc[evt.index[0]]['Full Path']
+        row_idx, col_idx = evt.index[0], evt.index[1]
+        if current_df_displayed.columns[col_idx] == 'Action':
+            # Scalar access; no row Series is built for the click
+            path_to_open = current_df_displayed.iat[row_idx, current_df_displayed.columns.get_loc('Full Path')]
             return open_containing_folder_os(path_to_open)
         return None
     except Exception as e:
@@ -613,11 +1221,12 @@ def attempt_inventory_recovery(xlsx_filepath):
             for temp_path in temp_path_candidates:
                 if os.path.exists(temp_path) and os.path.getsize(temp_path) > 0:
                     try:
-                        temp_df = pd.read_excel(temp_path, engine='openpyxl')
-                        if not temp_df.empty:
+                        if _is_recoverable_xlsx(temp_path):
                             os.replace(temp_path, xlsx_filepath)
                             print("Recovered from temporary save file")
                             return True
+                        if not _is_valid_xlsx_container(temp_path):
+                            raise zipfile.BadZipFile(temp_path)  # unreadable leftover: discarded below
                     except:
                         try:
                             os.remove(temp_path)
@@ -628,8 +1237,7 @@ def attempt_inventory_recovery(xlsx_filepath):
             # Then try backup
             if os.path.exists(backup_path) and os.path.getsize(backup_path) > 0:
                 try:
-                    backup_df = pd.read_excel(backup_path, engine='openpyxl')
-                    if not backup_df.empty:
+                    if _is_recoverable_xlsx(backup_path):
                         shutil.copy2(backup_path, xlsx_filepath)
                         print("Recovered from backup file")
                         return True
@@ -642,10 +1250,49 @@ def attempt_inventory_recovery(xlsx_filepath):
         return False
 
 
+def _state_frame(inventory_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    STATE_COLUMNS frame for an inventory (FIELDNAMES columns): 'Action' icon added,
+    display blanks filled and search columns prepared.
+    """
+    # Reindex gives a new frame in STATE_COLUMNS order
+    df_state = inventory_df.reindex(columns=STATE_COLUMNS)
+    df_state['Action'] = '📂'  # Add/ensure icon
+    # Blanks are filled once here, so pages are plain row/column slices
+    df_state[DISPLAY_COLUMNS] = df_state[DISPLAY_COLUMNS].fillna('')
+    _prepare_search_columns(df_state)
+    return df_state
+
+
+def load_inventory_snapshot(folder_path_input):
+    """
+    State frame from the folder's inventory snapshot, without rescanning, when the
+    snapshot matches the inventory file and no entry of the folder was added, removed or
+    renamed since it was written. Returns (df_state, status_msg, xlsx_path) or None.
+    """
+    if not folder_path_input or not os.path.isdir(folder_path_input):
+        return None
+    xlsx_for_this_folder = os.path.join(folder_path_input, INVENTORY_FILENAME)
+    # Compared by entry names, not folder mtime: our own writes (the snapshot's rename,
+    # backups) bump the folder mtime after the snapshot was written
+    try:
+        folder_entries = _folder_entries_key(folder_path_input).encode()
+    except OSError:
+        return None
+    if _snapshot_metadata(xlsx_for_this_folder).get(b'folder_entries') != folder_entries:
+        return None
+    inventory_df = _read_inventory_snapshot(xlsx_for_this_folder)
+    if inventory_df is None or inventory_df.empty:
+        return None
+    status_msg = (f"Loaded saved inventory ({len(inventory_df)} entries) without rescanning. "
+                  f"Click 'Scan Folder' to pick up changes in subfolders.")
+    return _state_frame(inventory_df), status_msg, xlsx_for_this_folder
+
+
 def run_scan_and_display(folder_path_input):
     try:
-        empty_df_for_display = pd.DataFrame(columns=DISPLAY_COLUMNS).fillna('')
-        empty_full_df_for_state = pd.DataFrame(columns=STATE_COLUMNS).fillna({'Action': '📂', 'Manual_Notes': ''})
+        empty_df_for_display = _EMPTY_DISPLAY_DF.copy()
+        empty_full_df_for_state = _EMPTY_STATE_DF.copy()
 
         if not folder_path_input or not os.path.isdir(folder_path_input):
             return empty_df_for_display, "Error: Invalid folder path.", "", empty_full_df_for_state, ""
@@ -653,51 +1300,169 @@ def run_scan_and_display(folder_path_input):
         xlsx_for_this_folder = os.path.join(folder_path_input, INVENTORY_FILENAME)
         print(f"Starting scan: {folder_path_input}. Inventory: {xlsx_for_this_folder}")
 
+        # Pending note saves land first, so the scan reads (and later rewrites) the latest notes
+        inventory_writer.wait(xlsx_for_this_folder)
+
         # Attempt recovery if needed
         if os.path.exists(xlsx_for_this_folder):
             attempt_inventory_recovery(xlsx_for_this_folder)
 
-        inventory_data_list, status_msg, _, _, _ = process_folder_inventory(folder_path_input, xlsx_for_this_folder, TOPIC_KEYWORDS)
+        inventory_df, status_msg, _, _, _, existing_notes = process_folder_inventory(folder_path_input, xlsx_for_this_folder, TOPIC_KEYWORDS)
 
-        df_full_state_candidate = empty_full_df_for_state.copy()
-        if inventory_data_list:
-            df_temp = pd.DataFrame(inventory_data_list)  # Contains FIELDNAMES columns
-            # Merge with an empty df that has all STATE_COLUMNS to ensure structure
-            df_full_state_candidate = pd.concat([empty_full_df_for_state, df_temp], ignore_index=True)
-            df_full_state_candidate = df_full_state_candidate.reindex(columns=STATE_COLUMNS)  # Ensure order
-            df_full_state_candidate['Action'] = '📂'  # Add/ensure icon
-            df_full_state_candidate['Manual_Notes'] = df_full_state_candidate['Manual_Notes'].fillna('')
+        df_full_state_candidate = empty_full_df_for_state
+        if not inventory_df.empty:
+            df_full_state_candidate = _state_frame(inventory_df)
 
-            if not df_full_state_candidate.empty:
-                # Save only data columns (FIELDNAMES) to Excel with merge protection for notes
-                save_inventory_to_xlsx(df_full_state_candidate[FIELDNAMES].to_dict(orient='records'), xlsx_for_this_folder)
+            # Save only data columns (FIELDNAMES) to Excel with merge protection for notes
+            # (save_inventory_to_xlsx reindexes to FIELDNAMES itself; a [FIELDNAMES] slice would be one more copy)
+            save_inventory_to_xlsx(df_full_state_candidate, xlsx_for_this_folder, existing_notes,
+                                   skip_if_unchanged=True)
 
         # Prepare display_df from df_full_state_candidate
-        display_df = df_full_state_candidate.reindex(columns=DISPLAY_COLUMNS).fillna('')
+        display_df = _display_rows(df_full_state_candidate)
 
-        return display_df, status_msg, xlsx_for_this_folder, df_full_state_candidate.copy(), xlsx_for_this_folder
+        # df_full_state_candidate is this call's own frame (reindex), no defensive copy needed
+        return display_df, status_msg, xlsx_for_this_folder, df_full_state_candidate, xlsx_for_this_folder
     except Exception as e:
         print(f"CRITICAL ERROR in run_scan_and_display: {e}")
         traceback.print_exc()
-        _empty_display = pd.DataFrame(columns=DISPLAY_COLUMNS).fillna('')
-        _empty_state = pd.DataFrame(columns=STATE_COLUMNS).fillna({'Action': '📂', 'Manual_Notes': ''})
+        _empty_display = _EMPTY_DISPLAY_DF.copy()
+        _empty_state = _EMPTY_STATE_DF.copy()
         return _empty_display, f"Error during scan: {e}", "", _empty_state, ""
 
 
-def _text_search_mask(series: pd.Series, terms):
-    mask = pd.Series(True, index=series.index)
-    s = series.astype(str).str.lower().fillna('')
+def _display_rows(df: pd.DataFrame, mask=None) -> pd.DataFrame:
+    """
+    DISPLAY_COLUMNS of the rows selected by mask (all rows if None), sliced in one step.
+    The scan fills blanks in DISPLAY_COLUMNS once, so no fillna is needed here.
+    """
+    rows = slice(None) if mask is None else mask
+    if set(DISPLAY_COLUMNS).issubset(df.columns):
+        return df.loc[rows, DISPLAY_COLUMNS].reset_index(drop=True)
+    return df.loc[rows].reindex(columns=DISPLAY_COLUMNS).reset_index(drop=True)
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """series as strings; pandas string columns are used as-is (astype(str) would make them object)."""
+    return series if isinstance(series.dtype, pd.StringDtype) else series.astype(str)
+
+
+def _search_blob(df: pd.DataFrame) -> pd.Series:
+    """Lowercased SEARCH_COLUMNS of df joined with ' || ' (the cross-column search text)."""
+    searched = [_as_text(df[col]) for col in SEARCH_COLUMNS if col in df.columns]
+    return searched[0].str.cat(searched[1:], sep=' || ', na_rep='').str.lower()
+
+
+def _prepare_search_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Once per scan: cast the searched columns to SEARCH_STRING_DTYPE (when pyarrow is
+    installed) and fill the SEARCH_SHADOW_COLUMNS and SEARCH_BLOB_COLUMN. Modifies df in place.
+    """
+    if SEARCH_STRING_DTYPE:
+        # Status too: its equality filter then also runs as an Arrow compute kernel
+        for col in SEARCH_COLUMNS + ['Folder Path', 'Status']:
+            df[col] = df[col].astype(SEARCH_STRING_DTYPE)
+    for col, shadow_col in SEARCH_SHADOW_COLUMNS.items():
+        df[shadow_col] = _as_text(df[col]).str.lower()
+    df[SEARCH_BLOB_COLUMN] = _search_blob(df)
+    return df
+
+
+_REGEX_META_CHARS = frozenset('.^$*+?{}[]\\|()')
+# Inventories from this many rows run the cross-column search on the GPU when cudf is installed
+CUDF_MIN_ROWS = 1_000_000
+# Device copy of the search column of the last frame searched there: (weakref to frame, cudf.Series)
+_GPU_SEARCH_CACHE = {}
+_GPU_SEARCH_LOCK = threading.Lock()
+
+
+def _gpu_search_mask(df: pd.DataFrame, combined: pd.Series, terms):
+    """
+    AND of the search terms over combined (already lowercase) with cudf string kernels,
+    as a numpy mask; None when cudf is missing, the frame is small or the GPU fails.
+    The device copy is reused while the same (never modified in place) state frame is searched.
+    """
+    if cudf is None or len(combined) < CUDF_MIN_ROWS:
+        return None
+    try:
+        with _GPU_SEARCH_LOCK:
+            cached_ref, gpu_series = _GPU_SEARCH_CACHE.get('frame', (None, None))
+            if cached_ref is None or cached_ref() is not df or len(gpu_series) != len(combined):
+                gpu_series = cudf.Series(combined.astype(object).to_numpy(dtype=object))
+                _GPU_SEARCH_CACHE['frame'] = (weakref.ref(df), gpu_series)
+        gpu_mask = None
+        for t in {term.strip().lower() for term in terms} - {''}:
+            # Same literal/regex split as _text_search_mask
+            use_regex = not any(ch in t for ch in ['\\', '/', ':']) and bool(set(t) & _REGEX_META_CHARS)
+            hits = gpu_series.str.contains(t, regex=use_regex).fillna(False)
+            gpu_mask = hits if gpu_mask is None else gpu_mask & hits
+        return np.ones(len(combined), dtype=bool) if gpu_mask is None else gpu_mask.to_numpy()
+    except Exception as e:
+        print(f"Warning: GPU search failed, using CPU: {e}")
+        return None
+
+
+# Upper bound for the fixed-width bytes copy that _ascii_find_mask searches (rows * longest value)
+SEARCH_BYTES_MAX = 256 * 1024 * 1024
+
+
+def _ascii_find_mask(values: np.ndarray, terms):
+    """
+    AND of literal substring matches as np.char.find over one fixed-width bytes copy
+    of values (C loop per term). None when a value is not ASCII text or the copy
+    would exceed SEARCH_BYTES_MAX; the caller then checks the strings in Python.
+    """
+    if not len(values) or not all(t.isascii() for t in terms):
+        return None
+    try:
+        lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+        if len(values) * int(lengths.max()) > SEARCH_BYTES_MAX:
+            return None
+        as_bytes = values.astype('S')  # raises on non-ASCII text
+    except (TypeError, UnicodeEncodeError):
+        return None
+    mask = np.ones(len(values), dtype=bool)
+    for t in terms:
+        mask &= np.char.find(as_bytes, t.encode('ascii')) >= 0
+    return mask
+
+
+def _text_search_mask(series: pd.Series, terms, lowered=False):
+    # numpy mask: the caller composes it with its other filters before slicing once
+    # lowered: series is already lowercase text (SEARCH_BLOB_COLUMN)
+    mask = np.ones(len(series), dtype=bool)
+    s = series if lowered else _as_text(series).str.lower().fillna('')
 
     def _is_pathy(t: str) -> bool:
         return any(ch in t for ch in ['\\', '/', ':'])
 
-    for term in terms:
-        t = term.strip().lower()
-        if not t:
-            continue
+    unique_terms = {term.strip().lower() for term in terms} - {''}
+
+    # Object columns: every term that matches literally (path-like, or no regex syntax) is
+    # checked at once: np.char.find over ASCII bytes, else one pass with C-level `in`
+    if not isinstance(s.dtype, pd.StringDtype):
+        literal_terms = sorted((t for t in unique_terms if _is_pathy(t) or not (set(t) & _REGEX_META_CHARS)),
+                               key=len, reverse=True)
+        if literal_terms:
+            values = s.to_numpy(dtype=object)
+            mask = _ascii_find_mask(values, literal_terms)
+            if mask is None:
+                mask = np.fromiter((isinstance(v, str) and all(t in v for t in literal_terms) for v in values),
+                                   dtype=bool, count=len(values))
+            unique_terms = unique_terms.difference(literal_terms)
+
+    # AND across terms: longest (usually most selective) first, and each later term
+    # only scans the rows still matching
+    for t in sorted(unique_terms, key=len, reverse=True):
+        candidates = np.flatnonzero(mask)
+        if not len(candidates):
+            break
         use_regex = not _is_pathy(t)   # literal for path-like strings
-        mask &= s.str.contains(t, na=False, regex=use_regex)
+        # Plain pattern string: Arrow string columns take it straight to their regex kernel,
+        # object columns compile it once through re's pattern cache
+        hits = s.iloc[candidates].str.contains(t, na=False, regex=use_regex).to_numpy(dtype=bool)
         #mask &= s.str.contains(t, na=False, regex=False)
+        mask[candidates[~hits]] = False
 
     return mask
 
@@ -714,6 +1479,92 @@ def _persistent_dir():
 RECENT_FOLDERS_FILE = os.path.join(_persistent_dir(), "recent_folders.txt")
 
 
+def _filter_mask(df_full: pd.DataFrame, status_filter: str, topic_filter_text: str, filename_filter_text: str) -> np.ndarray:
+    """
+    Boolean row mask for the status / topic / name-notes-path filters over df_full.
+    Kept separate from materialization so a view can hold just the selected rows.
+    """
+    df_filtered = df_full
+    # One combined boolean mask; the caller slices the frame once
+    mask = np.ones(len(df_filtered), dtype=bool)
+
+    # Status filter (unchanged)
+    if status_filter and status_filter != "All":
+        if 'Status' in df_filtered.columns:
+            mask &= (df_filtered['Status'] == status_filter).to_numpy(dtype=bool, na_value=False)
+        else:
+            return np.zeros(len(df_filtered), dtype=bool)
+
+    # Handle filename filter with folder inclusions/exclusions + cross-column term search
+    if filename_filter_text:
+        if not set(['File Name', 'Folder Path']).issubset(df_filtered.columns):
+            return np.zeros(len(df_filtered), dtype=bool)
+
+        # Split into folder filters and search terms
+        folder_excludes = []
+        folder_includes = []
+        search_terms = []
+
+        for term in filename_filter_text.split(','):
+            term = term.strip()
+            term_lower = term.lower()
+            if term_lower.startswith('folder:'):
+                folder_term = term[7:].strip()
+                if folder_term:
+                    folder_excludes.append(folder_term.lower())
+            elif term_lower.startswith('incfolder:'):
+                folder_term = term[10:].strip()
+                if folder_term:
+                    folder_includes.append(folder_term.lower())
+            else:
+                if term:
+                    search_terms.append(term)
+
+        # Each folder group is one alternation -> one column scan. Both sides are lowercase, and the
+        # pattern is passed as a string: Arrow string columns reject compiled patterns
+        folder_col = None
+        if folder_includes or folder_excludes:
+            shadow_col = SEARCH_SHADOW_COLUMNS['Folder Path']
+            folder_col = df_filtered[shadow_col] if shadow_col in df_filtered.columns else df_filtered['Folder Path'].astype(str).str.lower()
+
+        # Apply folder inclusions (OR logic - keep if matches any term)
+        if folder_includes:
+            mask &= folder_col.str.contains(_keyword_alternation(folder_includes).pattern, na=False).to_numpy(dtype=bool)
+
+        # Apply folder exclusions (OR logic - exclude if matches any term)
+        if folder_excludes:
+            mask &= ~folder_col.str.contains(_keyword_alternation(folder_excludes).pattern, na=False).to_numpy(dtype=bool)
+
+        # Cross-column search (AND across terms)
+        if search_terms:
+            # The scan precomputes the combined text; other frames build it here
+            if SEARCH_BLOB_COLUMN in df_filtered.columns:
+                combined = df_filtered[SEARCH_BLOB_COLUMN]
+            else:
+                combined = _search_blob(df_filtered)
+            gpu_mask = _gpu_search_mask(df_filtered, combined, search_terms)
+            mask &= gpu_mask if gpu_mask is not None else _text_search_mask(combined, search_terms, lowered=True)
+
+    # Topic filter (unchanged; AND across terms)
+    if topic_filter_text:
+        if 'Identified Topics (DOCX)' in df_filtered.columns:
+            shadow_col = SEARCH_SHADOW_COLUMNS['Identified Topics (DOCX)']
+            topics_lower = df_filtered[shadow_col] if shadow_col in df_filtered.columns else \
+                df_filtered['Identified Topics (DOCX)'].astype(str).str.lower()
+            topic_terms = [t.strip().lower() for t in topic_filter_text.split(',') if t.strip()]
+            # Terms are literal on both column types, so 'c++' or 'a.b' mean what they say
+            if topic_terms and isinstance(topics_lower.dtype, pd.StringDtype):
+                # Arrow's regex engine (RE2) has no lookahead: one literal kernel per term
+                for t in topic_terms:
+                    mask &= topics_lower.str.contains(t, na=False, regex=False).to_numpy(dtype=bool)
+            elif topic_terms:
+                # AND of all terms as one anchored lookahead pattern -> a single column scan
+                all_terms_pattern = '(?s)^' + ''.join(f'(?=.*{re.escape(t)})' for t in topic_terms)
+                mask &= topics_lower.str.contains(all_terms_pattern, na=False).to_numpy(dtype=bool)
+
+    return mask
+
+
 def filter_dataframe_display(df_full_from_state: pd.DataFrame, status_filter: str, topic_filter_text: str, filename_filter_text: str) -> pd.DataFrame:
     """
     Filtering improvements:
@@ -721,131 +1572,226 @@ def filter_dataframe_display(df_full_from_state: pd.DataFrame, status_filter: st
         * ALSO performs text search across File Name + Manual_Notes + Content Hint + Identified Topics (DOCX) + Full Path.
     """
     try:
-        empty_df_with_display_columns = pd.DataFrame(columns=DISPLAY_COLUMNS).fillna('')
-
         if not isinstance(df_full_from_state, pd.DataFrame) or df_full_from_state.empty:
-            return empty_df_with_display_columns
+            return _EMPTY_DISPLAY_DF.copy()
+        mask = _filter_mask(df_full_from_state, status_filter, topic_filter_text, filename_filter_text)
+        return _display_rows(df_full_from_state, mask)
+    except Exception as e:
+        print(f"CRITICAL ERROR in filter_dataframe_display: {e}")
+        traceback.print_exc()
+        return _EMPTY_DISPLAY_DF.copy()
+
+
+def _literal_search_terms(filename_filter_text: str):
+    """
+    Lowercased search terms of a filename filter, or None when any term is a
+    folder:/incfolder: filter or uses regex syntax (its matches don't nest).
+    """
+    terms = []
+    for term in (filename_filter_text or '').split(','):
+        term = term.strip().lower()
+        if not term:
+            continue
+        if term.startswith(('folder:', 'incfolder:')) or (set(term) & _REGEX_META_CHARS):
+            return None
+        terms.append(term)
+    return terms
+
+
+def _narrows_view(view, state_token: str, filters) -> bool:
+    """
+    True when filters can only select a subset of the rows of view: same state frame,
+    same status/topic, and every previous search term is contained in a new one
+    (terms are ANDed substring matches), e.g. typing "repo" -> "report" or adding a term.
+    """
+    if not view or not state_token or view.get('source') != state_token or view['filters'][:2] != filters[:2]:
+        return False
+    old_terms = _literal_search_terms(view['filters'][2])
+    new_terms = _literal_search_terms(filters[2])
+    if old_terms is None or new_terms is None:
+        return False
+    return all(any(old in new for new in new_terms) for old in old_terms)
 
-        df_filtered = df_full_from_state.copy()
 
-        # Status filter (unchanged)
-        if status_filter and status_filter != "All":
-            if 'Status' in df_filtered.columns:
-                df_filtered = df_filtered[df_filtered['Status'] == status_filter]
+def new_view(full_df: pd.DataFrame, status_filter="All", topic_filter_text="", filename_filter_text="", edits=None,
+             previous=None, state_token=""):
+    """
+    Lazy table view over the full state frame: the active filters, the positions of
+    the rows they select and pending note edits ({full_path: note}).
+    Nothing is materialized here; paginate_view builds one page at a time.
+    When the filters only narrow the previous view of the same state (state_token),
+    just its rows are re-filtered instead of the whole frame.
+    """
+    filters = (status_filter, topic_filter_text, filename_filter_text)
+    rows = np.empty(0, dtype=np.intp)
+    if isinstance(full_df, pd.DataFrame) and not full_df.empty:
+        try:
+            if _narrows_view(previous, state_token, filters):
+                prev_rows = previous['rows']
+                rows = prev_rows[_filter_mask(full_df.iloc[prev_rows], *filters)] if len(prev_rows) else prev_rows
             else:
-                return empty_df_with_display_columns.copy()
-
-        # Handle filename filter with folder inclusions/exclusions + cross-column term search
-        if filename_filter_text:
-            if not set(['File Name', 'Folder Path']).issubset(df_filtered.columns):
-                return empty_df_with_display_columns.copy()
-
-            # Split into folder filters and search terms
-            folder_excludes = []
-            folder_includes = []
-            search_terms = []
-
-            for term in filename_filter_text.split(','):
-                term = term.strip()
-                term_lower = term.lower()
-                if term_lower.startswith('folder:'):
-                    folder_term = term[7:].strip()
-                    if folder_term:
-                        folder_excludes.append(folder_term.lower())
-                elif term_lower.startswith('incfolder:'):
-                    folder_term = term[10:].strip()
-                    if folder_term:
-                        folder_includes.append(folder_term.lower())
-                else:
-                    if term:
-                        search_terms.append(term)
+                rows = np.flatnonzero(_filter_mask(full_df, *filters))
+        except Exception as e:
+            print(f"CRITICAL ERROR in new_view: {e}")
+            traceback.print_exc()
+    return {'filters': filters, 'rows': rows, 'edits': dict(edits or {}), 'source': state_token}
 
-            
-            # Apply folder inclusions (OR logic - keep if matches any term)
-            if folder_includes:
-                mask = pd.Series(False, index=df_filtered.index)
-                fp = df_filtered['Folder Path'].astype(str).str.lower()
-                for term in folder_includes:
-                    t = term.strip()
-                    if t:
-                        mask |= fp.str.contains(t, na=False, regex=False)  # literal
-                df_filtered = df_filtered[mask]
-            
-            # Apply folder exclusions (OR logic - exclude if matches any term)
-            if folder_excludes:
-                fp = df_filtered['Folder Path'].astype(str).str.lower()
-                for term in folder_excludes:
-                    t = term.strip()
-                    if t:
-                        df_filtered = df_filtered[~fp.str.contains(t, na=False, regex=False)]  # literal
 
+def paginate_view(full_df: pd.DataFrame, view, page):
+    """
+    Materialize one DISPLAY_PAGE_SIZE page of the view, with pending note edits applied.
+    Returns (page_df, page_label, page) with page clamped to the valid range.
+    """
+    rows = view['rows'] if view else ()
+    if not isinstance(full_df, pd.DataFrame) or len(rows) == 0:
+        return _EMPTY_DISPLAY_DF.copy(), "Page 1 of 1 (0 rows)", 0
+    page_count = (len(rows) - 1) // DISPLAY_PAGE_SIZE + 1
+    page = min(max(int(page or 0), 0), page_count - 1)
+    start = page * DISPLAY_PAGE_SIZE
+    page_df = _display_rows(full_df.iloc[rows[start:start + DISPLAY_PAGE_SIZE]])
+    if view['edits']:
+        edited_notes = page_df['Full Path'].map(view['edits'])
+        page_df['Manual_Notes'] = edited_notes.where(edited_notes.notna(), page_df['Manual_Notes'])
+    return page_df, f"Page {page + 1} of {page_count} ({len(rows)} rows)", page
+
+
+def record_page_edits(view, page_df: pd.DataFrame):
+    """
+    Remember the Manual_Notes shown on the page being left (matched on 'Full Path'),
+    so edits survive paging/filtering and are all saved together.
+    """
+    if not view or not isinstance(page_df, pd.DataFrame) or page_df.empty or \
+            'Full Path' not in page_df.columns or 'Manual_Notes' not in page_df.columns:
+        return view
+    edits = dict(view['edits'])
+    edits.update(zip(page_df['Full Path'], page_df['Manual_Notes'].fillna('')))
+    return {**view, 'edits': edits}
 
-            
-            # Cross-column search (AND across terms)
-            if search_terms:
-                columns_to_search = [
-                    'File Name',
-                    'Manual_Notes',
-                    'Content Hint',
-                    'Identified Topics (DOCX)',
-                    'Full Path',
-                    'Last Modified'   # <-- add this
-                ]
-                # Build combined string
-                combined = pd.Series('', index=df_filtered.index)
-                for col in columns_to_search:
-                    if col in df_filtered.columns:
-                        combined = combined.str.cat(df_filtered[col].astype(str).fillna(''), sep=' || ')
-                mask_all = _text_search_mask(combined, search_terms)
-                df_filtered = df_filtered[mask_all]
-
-
-        # Topic filter (unchanged; AND across terms)
-        if topic_filter_text:
-            if 'Identified Topics (DOCX)' in df_filtered.columns:
-                for term in [t for t in topic_filter_text.split(',') if t.strip()]:
-                    df_filtered = df_filtered[
-                        df_filtered['Identified Topics (DOCX)'].astype(str).str.lower().str.contains(term.strip().lower(), na=False)
-                    ]
-
-        return df_filtered.reindex(columns=DISPLAY_COLUMNS).fillna('')
-    except Exception as e:
-        print(f"CRITICAL ERROR in filter_dataframe_display: {e}")
-        traceback.print_exc()
-        return pd.DataFrame(columns=DISPLAY_COLUMNS).fillna('')
+
+def view_edits_frame(view) -> pd.DataFrame:
+    """Pending note edits of a view as a ('Full Path', 'Manual_Notes') frame for save_notes."""
+    edits = view['edits'] if view else {}
+    return pd.DataFrame({'Full Path': list(edits.keys()), 'Manual_Notes': list(edits.values())})
+
+
+class InventoryWriter:
+    """
+    Background inventory writes for save_notes. Requests for the same file that arrive
+    within SAVE_COALESCE_SECONDS are collapsed: only the newest frame is written.
+    """
+
+    def __init__(self):
+        self.coalesce_seconds = SAVE_COALESCE_SECONDS
+        self._cond = threading.Condition()
+        self._pending = {}   # xlsx_path -> newest frame to write
+        self._writing = set()
+        self._results = {}   # xlsx_path -> (ok, timestamp) of the last finished write
+        self._thread = None
+
+    def submit(self, xlsx_path, df: pd.DataFrame):
+        """Queue df to be written to xlsx_path (replacing any not yet written frame)."""
+        with self._cond:
+            self._pending[xlsx_path] = df
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="inventory-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def wait(self, xlsx_path=None, timeout=None):
+        """
+        Block until xlsx_path (every file if None) has no queued or running write.
+        Returns the (ok, timestamp) of its last write, or None.
+        """
+        def busy():
+            if xlsx_path is None:
+                return bool(self._pending or self._writing)
+            return xlsx_path in self._pending or xlsx_path in self._writing
+
+        with self._cond:
+            self._cond.wait_for(lambda: not busy(), timeout)
+            return self._results.get(xlsx_path) if xlsx_path else None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+            time.sleep(self.coalesce_seconds)  # let rapid successive saves pile up
+            with self._cond:
+                batch, self._pending = self._pending, {}
+                self._writing.update(batch)
+            for xlsx_path, df in batch.items():
+                try:
+                    ok = save_inventory_to_xlsx(df, xlsx_path)
+                except Exception as e:
+                    print(f"CRITICAL ERROR in background save of '{xlsx_path}': {e}")
+                    ok = False
+                with self._cond:
+                    self._writing.discard(xlsx_path)
+                    self._results[xlsx_path] = (ok, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                    self._cond.notify_all()
+
+
+inventory_writer = InventoryWriter()
+
+
+def inventory_write_status(xlsx_path, queued):
+    """(status_msg, last_saved) once the note save queued by save_notes for xlsx_path is on disk."""
+    result = inventory_writer.wait(xlsx_path) if queued and xlsx_path else None
+    if result is None:
+        return gr.update(), gr.update()
+    ok, timestamp = result
+    if ok:
+        return f"Notes saved successfully to {os.path.basename(xlsx_path)}. (at {timestamp})", f"Last saved: {timestamp}"
+    return "Error: Failed to save notes to file.", "Last saved: Error"
 
 
 def save_notes(displayed_df_with_edits: pd.DataFrame, full_df_from_state: pd.DataFrame, xlsx_path: str):
     """
     Update Manual_Notes in the master df state from the displayed (possibly filtered) df,
-    and persist to disk with merge protection to avoid note loss.
+    and queue it on inventory_writer (merge protection against note loss happens in the write).
+    Returns (state_df, status_msg, last_saved, queued); queued is True once the write was submitted.
     """
     try:
-        empty_state_df = pd.DataFrame(columns=STATE_COLUMNS).fillna({'Action': '📂', 'Manual_Notes': ''})
+        empty_state_df = _EMPTY_STATE_DF.copy()
         if not isinstance(full_df_from_state, pd.DataFrame) or full_df_from_state.empty:
-            return full_df_from_state.copy() if isinstance(full_df_from_state, pd.DataFrame) else empty_state_df, "Cannot save: Master data is empty.", "Last saved: Never"
+            return full_df_from_state.copy(deep=False) if isinstance(full_df_from_state, pd.DataFrame) else empty_state_df, "Cannot save: Master data is empty.", "Last saved: Never", False
 
         if not isinstance(displayed_df_with_edits, pd.DataFrame):
-            return full_df_from_state.copy(), "No data displayed to save from.", "Last saved: Never"
+            return full_df_from_state.copy(deep=False), "No data displayed to save from.", "Last saved: Never", False
 
-        updated_full_df = full_df_from_state.copy()  # Has 'Action' column
+        # Shallow copy: only the Manual_Notes column is replaced below
+        updated_full_df = full_df_from_state.copy(deep=False)  # Has 'Action' column
 
         if 'Full Path' not in updated_full_df.columns:
             print("CRITICAL: 'Full Path' column missing in full_df_from_state for save_notes.")
-            return full_df_from_state.copy(), "Error: 'Full Path' column missing.", "Last saved: Error"
-
-        updated_full_df.set_index('Full Path', inplace=True, drop=False)  # Keep 'Full Path' as column too for reindex
+            return full_df_from_state.copy(deep=False), "Error: 'Full Path' column missing.", "Last saved: Error", False
 
         if not displayed_df_with_edits.empty and \
                 'Full Path' in displayed_df_with_edits.columns and \
                 'Manual_Notes' in displayed_df_with_edits.columns:
-            notes_to_update_df = displayed_df_with_edits.set_index('Full Path')[['Manual_Notes']].fillna('')
-            updated_full_df.update(notes_to_update_df)  # Updates 'Manual_Notes' based on index
-
-        updated_full_df.reset_index(drop=True, inplace=True)  # Remove old index, keep 'Full Path' column
+            notes_map = dict(zip(displayed_df_with_edits['Full Path'], displayed_df_with_edits['Manual_Notes'].fillna('')))
+            if 'Manual_Notes' in updated_full_df.columns:
+                notes_col = updated_full_df['Manual_Notes'].to_numpy(dtype=object, copy=True)
+            else:
+                notes_col = np.full(len(updated_full_df), '', dtype=object)
+            # One hash lookup per row; rows without an edit map to NaN and keep their note
+            edited_notes = updated_full_df['Full Path'].map(notes_map)
+            edited_values = edited_notes.to_numpy(dtype=object)
+            changed_rows = np.flatnonzero(edited_notes.notna().to_numpy() & (edited_values != notes_col))
+            notes_col[changed_rows] = edited_values[changed_rows]
+            updated_full_df['Manual_Notes'] = notes_col
+
+            # Refresh the search text of edited rows only (new column: the input frame is shared)
+            if len(changed_rows) and SEARCH_BLOB_COLUMN in updated_full_df.columns:
+                blob_col = updated_full_df[SEARCH_BLOB_COLUMN].to_numpy(dtype=object, copy=True)
+                blob_col[changed_rows] = _search_blob(updated_full_df.iloc[changed_rows]).to_numpy(dtype=object)
+                updated_full_df[SEARCH_BLOB_COLUMN] = pd.array(blob_col, dtype=SEARCH_STRING_DTYPE) if SEARCH_STRING_DTYPE else blob_col
 
         # Ensure final state df has all STATE_COLUMNS and 'Action' is filled
-        final_df_for_state = updated_full_df.reindex(columns=STATE_COLUMNS)
+        if list(updated_full_df.columns) == STATE_COLUMNS:
+            final_df_for_state = updated_full_df
+        else:
+            final_df_for_state = updated_full_df.reindex(columns=STATE_COLUMNS)
         final_df_for_state['Action'] = final_df_for_state['Action'].fillna('📂')
         final_df_for_state['Manual_Notes'] = final_df_for_state['Manual_Notes'].fillna('')
 
@@ -854,53 +1800,112 @@ def save_notes(displayed_df_with_edits: pd.DataFrame, full_df_from_state: pd.Dat
 
         status_msg = "No valid path."
         if xlsx_path and isinstance(xlsx_path, str) and xlsx_path.strip():
-            # Save only FIELDNAMES (data columns) to Excel — with merge to preserve existing notes
-            if save_inventory_to_xlsx(final_df_for_state[FIELDNAMES].to_dict(orient='records'), xlsx_path):
-                status_msg = f"Notes saved successfully to {os.path.basename(xlsx_path)}. (at {timestamp})"
-            else:
-                status_msg = "Error: Failed to save notes to file."
+            # Written in the background; rapid successive saves become one write
+            inventory_writer.submit(xlsx_path, final_df_for_state)
+            status_msg = f"Notes saved, writing {os.path.basename(xlsx_path)}... (at {timestamp})"
+            return final_df_for_state, status_msg, "Last saved: pending", True
         else:
             status_msg = "Error: Inventory file path not set."
 
-        return final_df_for_state, status_msg, f"Last saved: {timestamp}"
+        return final_df_for_state, status_msg, f"Last saved: {timestamp}", False
     except Exception as e:
         print(f"CRITICAL ERROR in save_notes: {e}")
         traceback.print_exc()
-        _empty_state = pd.DataFrame(columns=STATE_COLUMNS).fillna({'Action': '📂', 'Manual_Notes': ''})
-        return full_df_from_state.copy() if isinstance(full_df_from_state, pd.DataFrame) else _empty_state, f"Error saving notes: {e}", "Last saved: Error"
+        _empty_state = _EMPTY_STATE_DF.copy()
+        return full_df_from_state.copy(deep=False) if isinstance(full_df_from_state, pd.DataFrame) else _empty_state, f"Error saving notes: {e}", "Last saved: Error", False
 
 
 class ErrorTracker:
     def __init__(self):
-        self.error_count = 0
-        self.last_error_time = None
-        self.max_errors = 3
-        self.error_window = 300  # 5 minutes
+        self.max_errors = MAX_ERROR_COUNT
+        self.error_window = ERROR_WINDOW_SECONDS  # 5 minutes
+        # Times of the last max_errors errors; a bounded deque append is atomic under the GIL
+        self._error_times = deque(maxlen=self.max_errors)
 
     def record_error(self):
-        now = time.time()
-        if self.last_error_time and (now - self.last_error_time) > self.error_window:
-            self.error_count = 0
-        self.error_count += 1
-        self.last_error_time = now
-        return self.error_count >= self.max_errors
+        """True once max_errors errors fall within error_window seconds."""
+        now = time.monotonic()
+        self._error_times.append(now)
+        return len(self._error_times) == self.max_errors and (now - self._error_times[0]) <= self.error_window
 
 
 error_tracker = ErrorTracker()
 
 
+# Full state frames live here, keyed by token; gr.State only carries the token.
+# Frames are owned by a browser session: one session's scans never evict another's,
+# and a session's frames are dropped when it ends (demo.unload).
+STATE_REGISTRY_MAX_PER_SESSION = 2
+_STATE_REGISTRY = OrderedDict()  # token -> (session, state frame)
+_STATE_REGISTRY_LOCK = threading.Lock()
+
+STATE_EXPIRED_MSG = ("Error: this page's inventory data is no longer on the server (e.g. after a restart). "
+                     "Rescan the folder to continue.")
+
+
+def register_state(df: pd.DataFrame, replaces: str = "", session: str = "") -> str:
+    """
+    Store a state frame for session and return its token. replaces is the token it
+    supersedes; beyond STATE_REGISTRY_MAX_PER_SESSION the session's oldest frames are dropped.
+    """
+    token = uuid.uuid4().hex
+    with _STATE_REGISTRY_LOCK:
+        if replaces:
+            _STATE_REGISTRY.pop(replaces, None)
+        _STATE_REGISTRY[token] = (session, df)
+        session_tokens = [t for t, (owner, _) in _STATE_REGISTRY.items() if owner == session]
+        for old_token in session_tokens[:-STATE_REGISTRY_MAX_PER_SESSION]:
+            del _STATE_REGISTRY[old_token]
+    return token
+
+
+def lookup_state(token: str):
+    """
+    State frame for token: an empty state frame before the first scan (no token),
+    None when the token is no longer registered.
+    """
+    if not token:
+        return _EMPTY_STATE_DF.copy()
+    with _STATE_REGISTRY_LOCK:
+        entry = _STATE_REGISTRY.get(token)
+    return entry[1] if entry is not None else None
+
+
+def release_session_states(session: str):
+    """Drop every state frame registered for session."""
+    with _STATE_REGISTRY_LOCK:
+        for token in [t for t, (owner, _) in _STATE_REGISTRY.items() if owner == session]:
+            del _STATE_REGISTRY[token]
+
+
+def state_from_inventory_file(xlsx_path):
+    """State frame rebuilt from the inventory on disk, or None if there is none."""
+    if not xlsx_path:
+        return None
+    inventory_writer.wait(xlsx_path)
+    if not os.path.exists(xlsx_path):
+        return None
+    records = list(load_existing_inventory(xlsx_path).values())
+    if not records:
+        return None
+    return _state_frame(pd.DataFrame.from_records(records).reindex(columns=FIELDNAMES))
+
+
 # =========================
 # Gradio UI
 # =========================
 with gr.Blocks(theme=gr.themes.Soft()) as demo:
-    # State holds data + 'Action' column for internal consistency
+    # State frames (data + 'Action' column) are kept in _STATE_REGISTRY; full_df_state holds the token
     # Initial empty state must match this structure
-    _initial_empty_state_df = pd.DataFrame(columns=STATE_COLUMNS)
-    _initial_empty_state_df['Action'] = '📂'  # Ensure Action column has icon even if 0 rows
-    _initial_empty_state_df['Manual_Notes'] = ''
+    _initial_empty_state_df = _EMPTY_STATE_DF.copy()
 
-    full_df_state = gr.State(_initial_empty_state_df)
+    full_df_state = gr.State("")  # token into _STATE_REGISTRY (frame with STATE_COLUMNS)
     current_xlsx_path_state = gr.State("")
+    # Lazy view over full_df_state (filters, selected rows, pending note edits) and its current page
+    view_state = gr.State(new_view(_initial_empty_state_df))
+    page_state = gr.State(0)
+    # True while a note save queued on inventory_writer has not been reported yet
+    write_queued_state = gr.State(False)
 
     # preload recent folders for the dropdown
     _choices, _value = load_recent_folders(initial_choice=START_FOLDER)
@@ -941,18 +1946,23 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:
     gr.Markdown("## Inventory Data (Click '📂' to open folder, edit 'Manual_Notes' column, then click 'Save Notes')")
 
     # dataframe_output displays DISPLAY_COLUMNS
-    _initial_empty_display_df = pd.DataFrame(columns=DISPLAY_COLUMNS).fillna('')
+    _initial_empty_display_df = _EMPTY_DISPLAY_DF.copy()
     dataframe_output = gr.DataFrame(
         value=_initial_empty_display_df,
         interactive=True, wrap=True, headers=DISPLAY_COLUMNS,
         datatype=['markdown'] + ['str'] * (len(DISPLAY_COLUMNS) - 1)
     )
 
+    with gr.Row():
+        prev_page_button = gr.Button("◀ Previous Page")
+        page_info = gr.Markdown("Page 1 of 1 (0 rows)")
+        next_page_button = gr.Button("Next Page ▶")
+
     with gr.Row():
         last_save_indicator = gr.Markdown("Last saved: Never")
 
     # Wrapper: remember folder, then run scan, then update dropdown choices
-    def scan_and_remember(folder_path_input):
+    def scan_and_remember(folder_path_input, state_token, request: gr.Request):
         # If valid, store to recent
         if folder_path_input and os.path.isdir(str(folder_path_input)):
             add_recent_folder(str(folder_path_input))
@@ -966,19 +1976,57 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:
         # Original behavior
         
         d, s, x, f, xs = run_scan_and_display(str(folder_path_input).strip() if folder_path_input else "")
+        state_token = register_state(f, replaces=state_token, session=request.session_hash)
+        view = new_view(f, state_token=state_token)
+        page_df, page_label, page = paginate_view(f, view, 0)
 
-        return d, s, x, f, xs, dropdown_update
+        return page_df, s, x, state_token, xs, dropdown_update, view, page, page_label
 
     scan_button.click(
         fn=scan_and_remember,
-        inputs=[folder_input],
-        outputs=[dataframe_output, status_output, current_xlsx_display, full_df_state, current_xlsx_path_state, folder_input]
+        inputs=[folder_input, full_df_state],
+        outputs=[dataframe_output, status_output, current_xlsx_display, full_df_state, current_xlsx_path_state, folder_input,
+                 view_state, page_state, page_info]
     )
 
+    # Re-filtering only replaces the view's row positions; pending note edits are kept
+    def filter_and_paginate(page_df, view, state_token, status_filter, topic_filter_text, filename_filter_text):
+        full_df = lookup_state(state_token)
+        view = record_page_edits(view, page_df)
+        if full_df is None:
+            # Keep the page and its edits; an empty result would look like "no matches"
+            return gr.update(), view, gr.update(), gr.update(), STATE_EXPIRED_MSG
+        view = new_view(full_df, status_filter, topic_filter_text, filename_filter_text,
+                        edits=view['edits'] if view else None, previous=view, state_token=state_token)
+        new_page_df, page_label, page = paginate_view(full_df, view, 0)
+        return new_page_df, view, page, page_label, gr.update()
+
+    # always_last: clicks arriving while a filter runs collapse into one final run
     filter_button.click(
-        fn=filter_dataframe_display,
-        inputs=[full_df_state, status_dropdown, topic_search, filename_search],
-        outputs=[dataframe_output]
+        fn=filter_and_paginate,
+        inputs=[dataframe_output, view_state, full_df_state, status_dropdown, topic_search, filename_search],
+        outputs=[dataframe_output, view_state, page_state, page_info, status_output],
+        trigger_mode="always_last"
+    )
+
+    # Paging keeps note edits from the page being left
+    def turn_page(page_df, view, state_token, page, step):
+        view = record_page_edits(view, page_df)
+        full_df = lookup_state(state_token)
+        if full_df is None:
+            return gr.update(), gr.update(), page, view, STATE_EXPIRED_MSG
+        new_page_df, page_label, new_page = paginate_view(full_df, view, page + step)
+        return new_page_df, page_label, new_page, view, gr.update()
+
+    prev_page_button.click(
+        fn=lambda page_df, view, state_token, page: turn_page(page_df, view, state_token, page, -1),
+        inputs=[dataframe_output, view_state, full_df_state, page_state],
+        outputs=[dataframe_output, page_info, page_state, view_state, status_output]
+    )
+    next_page_button.click(
+        fn=lambda page_df, view, state_token, page: turn_page(page_df, view, state_token, page, 1),
+        inputs=[dataframe_output, view_state, full_df_state, page_state],
+        outputs=[dataframe_output, page_info, page_state, view_state, status_output]
     )
     shutdown_button.click(
         fn=shutdown_server,
@@ -988,18 +2036,76 @@ with gr.Blocks(theme=gr.themes.Soft()) as demo:
     dataframe_output.select(
         fn=handle_action_click, inputs=[dataframe_output], outputs=[file_op_status_output]
     )
+    # Save edits from every visited page, not just the one on screen
+    def save_visible_notes(page_df, view, state_token, xlsx_path, request: gr.Request):
+        view = record_page_edits(view, page_df)
+        full_df = lookup_state(state_token)
+        if full_df is None:
+            # Edits are matched on 'Full Path', so they can still go into the inventory on disk
+            full_df = state_from_inventory_file(xlsx_path)
+            if full_df is None:
+                return state_token, STATE_EXPIRED_MSG + " Your note edits are kept on this page.", gr.update(), view, \
+                    gr.update(), False
+            state_df, status_msg, last_saved, queued = save_notes(view_edits_frame(view), full_df, xlsx_path)
+            new_token = register_state(state_df, session=request.session_hash)
+            notice = gr.update()
+            if queued:
+                # Row positions of the old view don't apply to the rebuilt frame
+                view = new_view(state_df, *view['filters'], state_token=new_token)
+                notice = ("This page's inventory data had expired on the server; notes were saved into the "
+                          "inventory file and filters now use it. Rescan to pick up folder changes.")
+            return new_token, status_msg, last_saved, view, notice, queued
+        state_df, status_msg, last_saved, queued = save_notes(view_edits_frame(view), full_df, xlsx_path)
+        # Saved edits now live in the state frame; row positions are unchanged
+        if view and queued:
+            view = {**view, 'edits': {}}
+        # Only a save replaces the registered frame (and so the token)
+        return register_state(state_df, replaces=state_token, session=request.session_hash), status_msg, last_saved, view, \
+            gr.update(), queued
+
+    # The click returns as soon as the notes are queued; the follow-up reports the finished write
     save_notes_button.click(
-        fn=save_notes,
-        inputs=[dataframe_output, full_df_state, current_xlsx_path_state],
-        outputs=[full_df_state, file_op_status_output, last_save_indicator]
+        fn=save_visible_notes,
+        inputs=[dataframe_output, view_state, full_df_state, current_xlsx_path_state],
+        outputs=[full_df_state, file_op_status_output, last_save_indicator, view_state, status_output, write_queued_state]
+    ).then(
+        fn=inventory_write_status,
+        inputs=[current_xlsx_path_state, write_queued_state],
+        outputs=[file_op_status_output, last_save_indicator]
     )
 
+    # On page load, show the preselected folder's saved inventory snapshot instead of an empty table
+    def load_startup_snapshot(folder_path_input, state_token, request: gr.Request):
+        snapshot = load_inventory_snapshot(str(folder_path_input).strip() if folder_path_input else "")
+        if snapshot is None:
+            return (gr.update(),) * 8
+        f, s, xs = snapshot
+        state_token = register_state(f, replaces=state_token, session=request.session_hash)
+        view = new_view(f, state_token=state_token)
+        page_df, page_label, page = paginate_view(f, view, 0)
+        return page_df, s, xs, state_token, xs, view, page, page_label
+
+    demo.load(
+        fn=load_startup_snapshot,
+        inputs=[folder_input, full_df_state],
+        outputs=[dataframe_output, status_output, current_xlsx_display, full_df_state, current_xlsx_path_state,
+                 view_state, page_state, page_info]
+    )
+
+    # A closed tab's state frames are freed right away
+    def release_closed_session(request: gr.Request):
+        release_session_states(request.session_hash)
+
+    demo.unload(release_closed_session)
+
 
 def setup_shutdown_handler():
     import atexit
 
     def cleanup():
         print("Performing cleanup before exit...")
+        # Queued note saves first
+        inventory_writer.wait(timeout=30)
         # Save any pending changes
         if hasattr(demo, 'current_xlsx_path_state') and demo.current_xlsx_path_state:
             try:
@@ -0,0 +1,16 @@
+import pytest
+
+import fileinventory_cgp as inv
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("héllo\n", "First 2 lines: héllo..."),
+    ("one\r\ntwo\r\nthree\r\n", "First 2 lines: one two..."),
+    ("one\n\nthree\n", "First 2 lines: one ..."),
+    ("", ".TXT: Empty"),
+])
+def test_text_hint_uses_the_first_two_lines(tmp_path, content, expected):
+    path = tmp_path / "f.txt"
+    path.write_bytes(content.encode("utf-8"))
+
+    assert inv.get_content_hint(str(path), ".txt") == expected
@@ -0,0 +1,80 @@
+import zipfile
+
+import pytest
+
+import fileinventory_cgp as inv
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RELS = (
+    '<?xml version="1.0"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Target="/word/document2.xml" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+    "</Relationships>"
+)
+
+
+def _docx(path, body, part="word/document.xml", rels=None):
+    with zipfile.ZipFile(path, "w") as z:
+        if rels:
+            z.writestr("_rels/.rels", rels)
+        z.writestr(part, f'<w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>')
+    return str(path)
+
+
+def test_tabs_and_breaks_are_kept_as_whitespace(tmp_path):
+    body = ('<w:p><w:r><w:t>Pet</w:t><w:tab/><w:t>tracer</w:t><w:br/><w:t>line</w:t>'
+            '<w:br w:type="page"/><w:t>two</w:t></w:r></w:p><w:p><w:r><w:t>next</w:t></w:r></w:p>')
+    path = _docx(tmp_path / "a.docx", body)
+
+    assert list(inv._docx_text_fast(path)) == ["Pet\ttracer\nlinetwo", "next"]
+
+
+def test_main_part_is_found_through_package_relationships(tmp_path):
+    path = _docx(tmp_path / "b.docx", "<w:p><w:r><w:t>Hello</w:t></w:r></w:p>",
+                 part="word/document2.xml", rels=RELS)
+
+    assert list(inv._docx_text_fast(path)) == ["Hello"]
+    assert inv.get_content_hint(path, ".docx") == "First para: Hello..."
+
+
+def test_only_body_paragraphs_count(tmp_path):
+    textbox = ('<w:r><w:t>Run </w:t><w:drawing><w:txbxContent><w:p><w:r><w:t>PET scan box</w:t></w:r></w:p>'
+               '</w:txbxContent></w:drawing><w:t>text</w:t></w:r>')
+    body = ('<w:tbl><w:tr><w:tc><w:p><w:r><w:t>PET imaging cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'
+            f'<w:p>{textbox}</w:p>'
+            '<w:p><w:hyperlink><w:r><w:t>Alzheimer disease</w:t></w:r></w:hyperlink></w:p>')
+    path = _docx(tmp_path / "c.docx", body)
+
+    assert list(inv._docx_text_fast(path)) == ["Run text", "Alzheimer disease"]
+    assert inv.get_content_hint(path, ".docx") == "First para: Run text..."
+    inv._load_docx_paragraphs.cache_clear()
+    assert inv.check_docx_for_topics(path, inv.TOPIC_KEYWORDS) == "AD"
+
+
+def test_paragraphs_match_python_docx(tmp_path):
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    document.add_table(rows=1, cols=1).cell(0, 0).text = "PET imaging cell"
+    document.add_paragraph("First\tbody")
+    document.add_paragraph("").add_run("line").add_break()
+    document.add_paragraph("Alzheimer disease")
+    path = str(tmp_path / "d.docx")
+    document.save(path)
+
+    assert list(inv._docx_text_fast(path)) == [p.text for p in docx.Document(path).paragraphs]
+
+
+def test_paragraph_cache_is_cleared_when_the_scan_fails(tmp_path, monkeypatch):
+    path = _docx(tmp_path / "e.docx", '<w:p><w:r><w:t>Body</w:t></w:r></w:p>')
+
+    def failing_enrich(paths, exts, topic_keywords_config):
+        inv._load_docx_paragraphs(path)
+        raise OSError("disk went away")
+        yield
+
+    monkeypatch.setattr(inv, "_enrich_files", failing_enrich)
+    with pytest.raises(OSError):
+        inv.process_folder_inventory(str(tmp_path), str(tmp_path / inv.INVENTORY_FILENAME), inv.TOPIC_KEYWORDS)
+
+    assert inv._load_docx_paragraphs.cache_info().currsize == 0
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import fileinventory_cgp as inv
+
+FILTERS = [
+    ("All", "", "folder:old"),
+    ("All", "", "IncFolder:Sub"),
+    ("All", "", "incfolder:sub, folder:old"),
+    ("All", "pet", ""),
+    ("All", "pet, alzheimer", ""),
+    ("All", "pet|mri", ""),
+    ("All", "c++", ""),
+    ("All", "a.b", ""),
+    ("All", "(x, c++", ""),
+    ("Active", "", "report"),
+    ("All", "", "rep.*t, keep"),
+    ("All", "", "/data/sub"),
+    ("Removed (Not Found)", "", ""),
+]
+
+
+def _inventory(string_dtype, monkeypatch):
+    monkeypatch.setattr(inv, "SEARCH_STRING_DTYPE", string_dtype)
+    df = pd.DataFrame({col: [""] * 5 for col in inv.FIELDNAMES})
+    df["Folder Path"] = ["/data", "/data/Sub", "/data/sub/old", "/data/OLD", "/data/sub"]
+    df["File Name"] = ["report.pdf", "notes.txt", "report_v2.docx", "x.py", "scan.docx"]
+    df["Full Path"] = df["Folder Path"] + "/" + df["File Name"]
+    df["Identified Topics (DOCX)"] = ["N/A", "C++ (x), a.b", "PET, Alzheimer", "axb", "MRI"]
+    df["Manual_Notes"] = ["", "keep this", "", "", ""]
+    df["Status"] = ["Active", "Active", "Updated", "Removed (Not Found)", "Active"]
+    return inv._state_frame(df)
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_object_and_arrow_columns_select_the_same_rows(filters, monkeypatch):
+    object_df = _inventory(None, monkeypatch)
+    arrow_df = _inventory("string[pyarrow]", monkeypatch)
+    assert arrow_df["File Name"].dtype == "string[pyarrow]"
+    assert object_df["File Name"].dtype == object
+
+    object_rows = np.flatnonzero(inv._filter_mask(object_df, *filters))
+    arrow_rows = np.flatnonzero(inv._filter_mask(arrow_df, *filters))
+
+    np.testing.assert_array_equal(object_rows, arrow_rows)
+
+
+@pytest.mark.parametrize("string_dtype", [None, "string[pyarrow]"])
+@pytest.mark.parametrize("topic_filter, rows", [("a.b", [1]), ("c++, (x", [1]), ("pet|mri", [])])
+def test_topic_terms_are_literal(string_dtype, topic_filter, rows, monkeypatch):
+    df = _inventory(string_dtype, monkeypatch)
+
+    assert list(np.flatnonzero(inv._filter_mask(df, "All", topic_filter, ""))) == rows
@@ -0,0 +1,30 @@
+import datetime
+import random
+import time
+
+import fileinventory_cgp as inv
+
+
+def _reference(mtimes):
+    return [datetime.datetime.fromtimestamp(m).isoformat() for m in mtimes]
+
+
+def test_format_matches_isoformat_byte_for_byte():
+    rng = random.Random(0)
+    mtimes = [rng.uniform(0, 2e9) for _ in range(20000)] + [1700000000.0, 1730615400.5, 0.0]
+
+    assert list(inv._format_mtimes(mtimes)) == _reference(mtimes)
+
+
+def test_format_is_not_slower_than_per_value_isoformat():
+    mtimes = [1.6e9 + i * 37.123456 for i in range(50000)]
+
+    start = time.perf_counter()
+    _reference(mtimes)
+    reference_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    inv._format_mtimes(mtimes)
+    formatted_seconds = time.perf_counter() - start
+
+    # Generous bound: only guards against a return to a much slower vectorized path
+    assert formatted_seconds < reference_seconds * 3 + 0.05
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import fileinventory_cgp as inv
+
+
+def _make_tree(root):
+    (root / "sub").mkdir()
+    (root / "a.txt").write_text("line one\nline two\n")
+    (root / "sub" / "b.md").write_text("# Title\n")
+
+
+def test_snapshot_written_by_scan_loads_back(tmp_path):
+    _make_tree(tmp_path)
+    inv.run_scan_and_display(str(tmp_path))
+
+    snapshot = inv.load_inventory_snapshot(str(tmp_path))
+
+    assert snapshot is not None
+    df_state, _, xlsx_path = snapshot
+    assert xlsx_path == os.path.join(str(tmp_path), inv.INVENTORY_FILENAME)
+    assert sorted(df_state["File Name"]) == ["a.txt", "b.md"]
+
+
+def test_snapshot_survives_backups_but_not_new_entries(tmp_path):
+    _make_tree(tmp_path)
+    inv.run_scan_and_display(str(tmp_path))
+    inv.create_backup(os.path.join(str(tmp_path), inv.INVENTORY_FILENAME))
+
+    assert inv.load_inventory_snapshot(str(tmp_path)) is not None
+
+    (tmp_path / "new.txt").write_text("x\n")
+    assert inv.load_inventory_snapshot(str(tmp_path)) is None
+
+
+def test_snapshot_ignored_after_inventory_changes(tmp_path):
+    _make_tree(tmp_path)
+    inv.run_scan_and_display(str(tmp_path))
+    xlsx_path = os.path.join(str(tmp_path), inv.INVENTORY_FILENAME)
+    with open(xlsx_path, "ab") as f:
+        f.write(b"\0")
+
+    assert inv.load_inventory_snapshot(str(tmp_path)) is None
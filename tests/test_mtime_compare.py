@@ -0,0 +1,45 @@
+import os
+import time
+
+import pytest
+
+import fileinventory_cgp as inv
+
+# 2024-11-03 01:30:00.5 EST: the second pass through the repeated fall-back hour
+FALL_BACK_MTIME = 1730615400.5
+
+
+@pytest.fixture
+def new_york_time(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available on this platform")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_file_in_repeated_hour_stays_active(tmp_path, new_york_time):
+    path = tmp_path / "f.txt"
+    path.write_text("hi\n")
+    os.utime(path, (FALL_BACK_MTIME, FALL_BACK_MTIME))
+    xlsx_path = str(tmp_path / inv.INVENTORY_FILENAME)
+
+    inv.run_scan_and_display(str(tmp_path))
+    inventory_df = inv.process_folder_inventory(str(tmp_path), xlsx_path, inv.TOPIC_KEYWORDS)[0]
+
+    assert list(inventory_df["Status"]) == ["Active"]
+
+
+def test_touched_file_is_updated(tmp_path):
+    path = tmp_path / "f.txt"
+    path.write_text("hi\n")
+    os.utime(path, (1700000000.25, 1700000000.25))
+    xlsx_path = str(tmp_path / inv.INVENTORY_FILENAME)
+
+    inv.run_scan_and_display(str(tmp_path))
+    os.utime(path, (1700000001.25, 1700000001.25))
+    inventory_df = inv.process_folder_inventory(str(tmp_path), xlsx_path, inv.TOPIC_KEYWORDS)[0]
+
+    assert list(inventory_df["Status"]) == ["Updated"]
@@ -0,0 +1,33 @@
+import pandas as pd
+
+import fileinventory_cgp as inv
+
+
+def _state():
+    df = pd.DataFrame({col: [""] for col in inv.FIELDNAMES})
+    df["Folder Path"] = ["/data"]
+    df["File Name"] = ["a.txt"]
+    df["Full Path"] = ["/data/a.txt"]
+    df["Status"] = ["Active"]
+    return inv._state_frame(df)
+
+
+def test_queued_save_is_reported_once_written(tmp_path):
+    xlsx_path = str(tmp_path / inv.INVENTORY_FILENAME)
+    state = _state()
+    edits = pd.DataFrame({"Full Path": ["/data/a.txt"], "Manual_Notes": ["checked"]})
+
+    state_df, status_msg, last_saved, queued = inv.save_notes(edits, state, xlsx_path)
+
+    assert queued is True
+    assert list(state_df["Manual_Notes"]) == ["checked"]
+    status_msg, last_saved = inv.inventory_write_status(xlsx_path, queued)
+    assert status_msg.startswith("Notes saved successfully")
+
+
+def test_nothing_is_awaited_when_no_write_was_queued():
+    state_df, status_msg, last_saved, queued = inv.save_notes(pd.DataFrame(), _state(), "")
+
+    assert queued is False
+    assert status_msg == "Error: Inventory file path not set."
+    assert inv.inventory_write_status("", queued) == (inv.gr.update(), inv.gr.update())
@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+import fileinventory_cgp as inv
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs os.symlink")
+def test_symlinks_use_target_stat_and_broken_links_are_skipped(tmp_path):
+    target = tmp_path / "target.txt"
+    target.write_text("x" * 100)
+    os.utime(target, (1_600_000_000, 1_600_000_000))
+    (tmp_path / "link.txt").symlink_to(target)
+    (tmp_path / "broken.txt").symlink_to(tmp_path / "missing.txt")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "inner.md").write_text("y")
+    (tmp_path / "dirlink").symlink_to(tmp_path / "sub", target_is_directory=True)
+
+    rows = {row[1]: row for row in inv._scan_metadata(str(tmp_path), str(tmp_path / inv.INVENTORY_FILENAME))}
+
+    assert sorted(rows) == ["inner.md", "link.txt", "target.txt"]
+    assert rows["link.txt"][3:5] == (100, 1_600_000_000)
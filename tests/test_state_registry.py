@@ -0,0 +1,37 @@
+import pandas as pd
+
+import fileinventory_cgp as inv
+
+
+def _frame():
+    return pd.DataFrame({"Full Path": ["/x"]})
+
+
+def test_other_sessions_do_not_evict_a_live_token():
+    live = inv.register_state(_frame(), session="tab-a")
+    token = ""
+    for _ in range(inv.STATE_REGISTRY_MAX_PER_SESSION + 5):
+        inv.register_state(_frame(), session="tab-b")
+        token = inv.register_state(_frame(), replaces=token, session="tab-c")
+
+    assert inv.lookup_state(live) is not None
+    inv.release_session_states("tab-a")
+    inv.release_session_states("tab-b")
+    inv.release_session_states("tab-c")
+
+
+def test_replaced_and_released_tokens_are_reported_missing():
+    first = inv.register_state(_frame(), session="tab-d")
+    second = inv.register_state(_frame(), replaces=first, session="tab-d")
+
+    assert inv.lookup_state(first) is None
+    assert inv.lookup_state(second) is not None
+    inv.release_session_states("tab-d")
+    assert inv.lookup_state(second) is None
+
+
+def test_no_token_yet_is_an_empty_state_frame():
+    df = inv.lookup_state("")
+
+    assert df.empty
+    assert list(df.columns) == inv.STATE_COLUMNS